@@ -51,7 +51,7 @@ def generate_modern_design_blueprint(request, MODERN_COLOR_SCHEMES, MODERN_LAYOU
     layout_names = list(MODERN_LAYOUTS.keys())
     layout_name = random.choice(layout_names)
     layout = MODERN_LAYOUTS[layout_name]
-    print(f"   Layout: {layout['name']}")
+    print(f"   Layout: {layout.name}")
     
     # Generate MODERN content based on category
     headlines = MODERN_HEADLINES.get(category, MODERN_HEADLINES["default"])
@@ -63,10 +63,10 @@ def generate_modern_design_blueprint(request, MODERN_COLOR_SCHEMES, MODERN_LAYOU
     
     # MODERN font selection
     font_data = random.choice(MODERN_FONTS)
-    font_family = font_data["name"]
-    headline_weight = max(font_data["weights"])
-    subheadline_weight = min([w for w in font_data["weights"] if w >= 400])
-    print(f"   Font: {font_family} ({font_data['style']} style)")
+    font_family = font_data.name
+    headline_weight = max(font_data.weights)
+    subheadline_weight = min([w for w in font_data.weights if w >= 400])
+    print(f"   Font: {font_family} ({font_data.style} style)")
     
     # Font sizes - LARGER for impact
     headline_size = 82 if format_key == "square" else (68 if format_key == "story" else 58)
@@ -77,38 +77,38 @@ def generate_modern_design_blueprint(request, MODERN_COLOR_SCHEMES, MODERN_LAYOU
     elements = []
     
     # === HEADLINE ===
-    hl = layout["headline"]
+    hl = layout.headline
     elements.append({
         "type": "text",
         "id": "headline_1",
         "content": headline,
         "style": "headline",
-        "position": {"x": hl["x"], "y": hl["y"]},
-        "size": {"width": hl["w"], "height": hl["h"]},
+        "position": {"x": hl.x, "y": hl.y},
+        "size": {"width": hl.w, "height": hl.h},
         "font_family": font_family,
         "font_size": headline_size,
         "font_weight": headline_weight,
         "color": color_scheme["text_primary"],
-        "align": hl["align"],
+        "align": hl.align,
         "line_height": 1.05,
         "letter_spacing": -1.5,
         "text_shadow": "0 4px 12px rgba(0,0,0,0.15)"
     })
     
     # === SUBHEADLINE ===
-    sh = layout["subheadline"]
+    sh = layout.subheadline
     elements.append({
         "type": "text",
         "id": "subheadline_1",
         "content": subheadline,
         "style": "subheadline",
-        "position": {"x": sh["x"], "y": sh["y"]},
-        "size": {"width": sh["w"], "height": sh["h"]},
+        "position": {"x": sh.x, "y": sh.y},
+        "size": {"width": sh.w, "height": sh.h},
         "font_family": font_family,
         "font_size": subheadline_size,
         "font_weight": subheadline_weight,
         "color": color_scheme["text_secondary"],
-        "align": sh["align"],
+        "align": sh.align,
         "line_height": 1.4,
         "letter_spacing": 0.3,
         "opacity": 0.9
@@ -116,8 +116,8 @@ def generate_modern_design_blueprint(request, MODERN_COLOR_SCHEMES, MODERN_LAYOU
     
     # === BODY TEXT (if layout supports it) ===
     body_text = None
-    if layout.get("body"):
-        body = layout["body"]
+    if layout.body:
+        body = layout.body
         # Generate contextual body text
         body_texts = {
             "tech": "Experience innovation that adapts to your needs",
@@ -135,20 +135,20 @@ def generate_modern_design_blueprint(request, MODERN_COLOR_SCHEMES, MODERN_LAYOU
             "id": "body_1",
             "content": body_text,
             "style": "body",
-            "position": {"x": body["x"], "y": body["y"]},
-            "size": {"width": body["w"], "height": body["h"]},
+            "position": {"x": body.x, "y": body.y},
+            "size": {"width": body.w, "height": body.h},
             "font_family": font_family,
             "font_size": body_size,
             "font_weight": 400,
             "color": color_scheme["text_secondary"],
-            "align": body["align"],
+            "align": body.align,
             "line_height": 1.6,
             "letter_spacing": 0.2,
             "opacity": 0.8
         })
     
     # === CTA BUTTON (MODERN STYLE) ===
-    cta_pos = layout["cta"]
+    cta_pos = layout.cta
     # Modern button styles
     button_styles = [
         {"radius": 8, "shadow": "0 4px 20px rgba(0,0,0,0.25)", "style": "sharp"},
@@ -161,8 +161,8 @@ def generate_modern_design_blueprint(request, MODERN_COLOR_SCHEMES, MODERN_LAYOU
         "type": "cta_button",
         "id": "cta_1",
         "text": cta,
-        "position": {"x": cta_pos["x"], "y": cta_pos["y"]},
-        "size": {"width": cta_pos["w"], "height": cta_pos["h"]},
+        "position": {"x": cta_pos.x, "y": cta_pos.y},
+        "size": {"width": cta_pos.w, "height": cta_pos.h},
         "background_color": color_scheme["accent"],
         "text_color": "#FFFFFF",
         "font_size": 20,
@@ -175,22 +175,22 @@ def generate_modern_design_blueprint(request, MODERN_COLOR_SCHEMES, MODERN_LAYOU
     
     # === DECORATIVE ELEMENTS ===
     # Add layout-specific decorations
-    if layout.get("decoration"):
-        for i, deco in enumerate(layout["decoration"]):
-            deco_type = deco["type"]
+    if layout.decoration:
+        for i, deco in enumerate(layout.decoration):
+            deco_type = deco.type
             
             if deco_type == "circle":
                 elements.append({
                     "type": "shape",
                     "id": f"deco_circle_{i}",
                     "shape_type": "circle",
-                    "position": {"x": deco["x"], "y": deco["y"]},
-                    "size": {"width": deco["w"], "height": deco["h"]},
+                    "position": {"x": deco.x, "y": deco.y},
+                    "size": {"width": deco.w, "height": deco.h},
                     "fill_color": color_scheme["primary"],
                     "stroke_color": None,
                     "stroke_width": 0,
-                    "opacity": deco.get("opacity", 0.15),
-                    "blur": deco.get("blur", 0),
+                    "opacity": deco.opacity,
+                    "blur": deco.blur,
                     "corner_radius": 0
                 })
             
@@ -199,14 +199,14 @@ def generate_modern_design_blueprint(request, MODERN_COLOR_SCHEMES, MODERN_LAYOU
                     "type": "shape",
                     "id": f"deco_rect_{i}",
                     "shape_type": "rectangle",
-                    "position": {"x": deco["x"], "y": deco["y"]},
-                    "size": {"width": deco["w"], "height": deco["h"]},
-                    "fill_color": color_scheme["secondary"] if deco.get("stroke") else color_scheme["primary"],
-                    "stroke_color": color_scheme["primary"] if deco.get("stroke") else None,
-                    "stroke_width": deco.get("stroke", 0),
-                    "opacity": deco.get("opacity", 0.1),
-                    "corner_radius": deco.get("radius", 0),
-                    "rotation": deco.get("rotation", 0)
+                    "position": {"x": deco.x, "y": deco.y},
+                    "size": {"width": deco.w, "height": deco.h},
+                    "fill_color": color_scheme["secondary"] if deco.stroke else color_scheme["primary"],
+                    "stroke_color": color_scheme["primary"] if deco.stroke else None,
+                    "stroke_width": deco.stroke,
+                    "opacity": deco.opacity,
+                    "corner_radius": deco.radius,
+                    "rotation": deco.rotation
                 })
             
             elif deco_type == "line":
@@ -214,12 +214,12 @@ def generate_modern_design_blueprint(request, MODERN_COLOR_SCHEMES, MODERN_LAYOU
                     "type": "shape",
                     "id": f"deco_line_{i}",
                     "shape_type": "line",
-                    "position": {"x": deco["x"], "y": deco["y"]},
-                    "size": {"width": deco["w"], "height": deco["h"]},
+                    "position": {"x": deco.x, "y": deco.y},
+                    "size": {"width": deco.w, "height": deco.h},
                     "fill_color": None,
                     "stroke_color": color_scheme["primary"],
-                    "stroke_width": max(deco["w"], deco["h"]) * 10,  # Scale for visibility
-                    "opacity": deco.get("opacity", 0.2),
+                    "stroke_width": max(deco.w, deco.h) * 10,  # Scale for visibility
+                    "opacity": deco.opacity,
                     "corner_radius": 0
                 })
     
@@ -304,7 +304,7 @@ def generate_modern_design_blueprint(request, MODERN_COLOR_SCHEMES, MODERN_LAYOU
             "industry": request.industry or category,
             "campaign_type": "advertising",
             "target_audience": "general",
-            "design_style": f"{layout['name']} - {scheme_name}",
+            "design_style": f"{layout.name} - {scheme_name}",
             "font_family": font_family
         },
         "headline": headline,
@@ -326,7 +326,7 @@ def generate_modern_design_blueprint(request, MODERN_COLOR_SCHEMES, MODERN_LAYOU
             "text_secondary": color_scheme["text_secondary"]
         },
         "elements": elements,
-        "design_notes": f"Modern {category} design with {layout['name']} layout and {scheme_name} color scheme."
+        "design_notes": f"Modern {category} design with {layout.name} layout and {scheme_name} color scheme."
     }
     
     return blueprint
@@ -4,7 +4,8 @@ Creates high-quality, advertising-ready poster designs
 """
 
 import random
-from typing import Dict, List, Any
+from functools import lru_cache
+from typing import Dict, List, Any, NamedTuple, Optional, Tuple
 
 # =============================================================================
 # MODERN COLOR SCHEMES - Professional & Trendy
@@ -85,138 +86,182 @@ MODERN_COLOR_SCHEMES = {
     }
 }
 
+# =============================================================================
+# LAYOUT RECORDS
+# =============================================================================
+
+class Box(NamedTuple):
+    """Layout slot in percentage coordinates"""
+    x: float
+    y: float
+    w: float
+    h: float
+    align: Optional[str] = None
+
+class Decoration(NamedTuple):
+    """Decorative shape in percentage coordinates"""
+    type: str
+    x: float
+    y: float
+    w: float
+    h: float
+    opacity: float
+    stroke: float = 0
+    rotation: float = 0
+    blur: float = 0
+    radius: float = 0
+
+class ModernLayout(NamedTuple):
+    """Fixed-shape layout record; slots are read by attribute"""
+    name: str
+    description: str
+    headline: Box
+    subheadline: Box
+    body: Optional[Box]
+    cta: Box
+    decoration: Tuple[Decoration, ...] = ()
+    image_area: Optional[Box] = None
+
 # =============================================================================
 # MODERN LAYOUTS - Professional Grid-Based
 # =============================================================================
 
 MODERN_LAYOUTS = {
-    "hero_split": {
-        "name": "Hero Split",
-        "description": "Bold headline on left, visual space on right",
-        "headline": {"x": 8, "y": 30, "w": 45, "h": 25, "align": "left"},
-        "subheadline": {"x": 8, "y": 58, "w": 40, "h": 12, "align": "left"},
-        "body": {"x": 8, "y": 72, "w": 40, "h": 8, "align": "left"},
-        "cta": {"x": 8, "y": 85, "w": 25, "h": 7, "align": "left"},
-        "image_area": {"x": 55, "y": 15, "w": 40, "h": 70},
-        "decoration": [
-            {"type": "rect", "x": 0, "y": 0, "w": 50, "h": 100, "opacity": 0.05},
-            {"type": "line", "x": 52, "y": 10, "w": 2, "h": 80, "opacity": 0.2}
-        ]
-    },
-    "centered_hero": {
-        "name": "Centered Hero",
-        "description": "Central focal point with surrounding elements",
-        "headline": {"x": 10, "y": 35, "w": 80, "h": 20, "align": "center"},
-        "subheadline": {"x": 15, "y": 58, "w": 70, "h": 10, "align": "center"},
-        "body": {"x": 20, "y": 70, "w": 60, "h": 8, "align": "center"},
-        "cta": {"x": 35, "y": 82, "w": 30, "h": 7, "align": "center"},
-        "decoration": [
-            {"type": "circle", "x": 85, "y": 10, "w": 20, "h": 20, "opacity": 0.15},
-            {"type": "circle", "x": -5, "y": 75, "w": 25, "h": 25, "opacity": 0.12},
-            {"type": "rect", "x": 5, "y": 5, "w": 90, "h": 90, "opacity": 0, "stroke": 2}
-        ]
-    },
-    "asymmetric_bold": {
-        "name": "Asymmetric Bold",
-        "description": "Off-center design for visual interest",
-        "headline": {"x": 12, "y": 20, "w": 60, "h": 30, "align": "left"},
-        "subheadline": {"x": 12, "y": 53, "w": 50, "h": 12, "align": "left"},
-        "body": {"x": 12, "y": 68, "w": 45, "h": 10, "align": "left"},
-        "cta": {"x": 12, "y": 82, "w": 30, "h": 8, "align": "left"},
-        "decoration": [
-            {"type": "rect", "x": 70, "y": 0, "w": 30, "h": 100, "opacity": 0.08},
-            {"type": "circle", "x": 75, "y": 30, "w": 35, "h": 35, "opacity": 0.12}
-        ]
-    },
-    "magazine_style": {
-        "name": "Magazine Style",
-        "description": "Editorial-inspired layout",
-        "headline": {"x": 8, "y": 15, "w": 55, "h": 22, "align": "left"},
-        "subheadline": {"x": 8, "y": 40, "w": 50, "h": 8, "align": "left"},
-        "body": {"x": 8, "y": 50, "w": 45, "h": 15, "align": "left"},
-        "cta": {"x": 8, "y": 70, "w": 28, "h": 7, "align": "left"},
-        "image_area": {"x": 55, "y": 30, "w": 40, "h": 55},
-        "decoration": [
-            {"type": "line", "x": 8, "y": 12, "w": 15, "h": 0.5, "opacity": 0.8},
-            {"type": "rect", "x": 0, "y": 0, "w": 100, "h": 3, "opacity": 0.1}
-        ]
-    },
-    "minimal_modern": {
-        "name": "Minimal Modern",
-        "description": "Clean, spacious, modern",
-        "headline": {"x": 10, "y": 40, "w": 80, "h": 18, "align": "center"},
-        "subheadline": {"x": 20, "y": 62, "w": 60, "h": 8, "align": "center"},
-        "body": {"x": 25, "y": 72, "w": 50, "h": 8, "align": "center"},
-        "cta": {"x": 37.5, "y": 85, "w": 25, "h": 6, "align": "center"},
-        "decoration": [
-            {"type": "rect", "x": 10, "y": 35, "w": 80, "h": 0.3, "opacity": 0.2},
-            {"type": "rect", "x": 10, "y": 90, "w": 80, "h": 0.3, "opacity": 0.2}
-        ]
-    },
-    "impact_banner": {
-        "name": "Impact Banner",
-        "description": "Large text with striking visuals",
-        "headline": {"x": 5, "y": 25, "w": 90, "h": 35, "align": "center"},
-        "subheadline": {"x": 15, "y": 63, "w": 70, "h": 10, "align": "center"},
-        "body": None,
-        "cta": {"x": 32.5, "y": 78, "w": 35, "h": 9, "align": "center"},
-        "decoration": [
-            {"type": "rect", "x": 0, "y": 0, "w": 100, "h": 20, "opacity": 0.05},
-            {"type": "rect", "x": 0, "y": 80, "w": 100, "h": 20, "opacity": 0.05}
-        ]
-    }
+    "hero_split": ModernLayout(
+        name="Hero Split",
+        description="Bold headline on left, visual space on right",
+        headline=Box(8, 30, 45, 25, "left"),
+        subheadline=Box(8, 58, 40, 12, "left"),
+        body=Box(8, 72, 40, 8, "left"),
+        cta=Box(8, 85, 25, 7, "left"),
+        image_area=Box(55, 15, 40, 70),
+        decoration=(
+            Decoration("rect", 0, 0, 50, 100, 0.05),
+            Decoration("line", 52, 10, 2, 80, 0.2)
+        )
+    ),
+    "centered_hero": ModernLayout(
+        name="Centered Hero",
+        description="Central focal point with surrounding elements",
+        headline=Box(10, 35, 80, 20, "center"),
+        subheadline=Box(15, 58, 70, 10, "center"),
+        body=Box(20, 70, 60, 8, "center"),
+        cta=Box(35, 82, 30, 7, "center"),
+        decoration=(
+            Decoration("circle", 85, 10, 20, 20, 0.15),
+            Decoration("circle", -5, 75, 25, 25, 0.12),
+            Decoration("rect", 5, 5, 90, 90, 0, stroke=2)
+        )
+    ),
+    "asymmetric_bold": ModernLayout(
+        name="Asymmetric Bold",
+        description="Off-center design for visual interest",
+        headline=Box(12, 20, 60, 30, "left"),
+        subheadline=Box(12, 53, 50, 12, "left"),
+        body=Box(12, 68, 45, 10, "left"),
+        cta=Box(12, 82, 30, 8, "left"),
+        decoration=(
+            Decoration("rect", 70, 0, 30, 100, 0.08),
+            Decoration("circle", 75, 30, 35, 35, 0.12)
+        )
+    ),
+    "magazine_style": ModernLayout(
+        name="Magazine Style",
+        description="Editorial-inspired layout",
+        headline=Box(8, 15, 55, 22, "left"),
+        subheadline=Box(8, 40, 50, 8, "left"),
+        body=Box(8, 50, 45, 15, "left"),
+        cta=Box(8, 70, 28, 7, "left"),
+        image_area=Box(55, 30, 40, 55),
+        decoration=(
+            Decoration("line", 8, 12, 15, 0.5, 0.8),
+            Decoration("rect", 0, 0, 100, 3, 0.1)
+        )
+    ),
+    "minimal_modern": ModernLayout(
+        name="Minimal Modern",
+        description="Clean, spacious, modern",
+        headline=Box(10, 40, 80, 18, "center"),
+        subheadline=Box(20, 62, 60, 8, "center"),
+        body=Box(25, 72, 50, 8, "center"),
+        cta=Box(37.5, 85, 25, 6, "center"),
+        decoration=(
+            Decoration("rect", 10, 35, 80, 0.3, 0.2),
+            Decoration("rect", 10, 90, 80, 0.3, 0.2)
+        )
+    ),
+    "impact_banner": ModernLayout(
+        name="Impact Banner",
+        description="Large text with striking visuals",
+        headline=Box(5, 25, 90, 35, "center"),
+        subheadline=Box(15, 63, 70, 10, "center"),
+        body=None,
+        cta=Box(32.5, 78, 35, 9, "center"),
+        decoration=(
+            Decoration("rect", 0, 0, 100, 20, 0.05),
+            Decoration("rect", 0, 80, 100, 20, 0.05)
+        )
+    )
 }
 
 # =============================================================================
 # MODERN TYPOGRAPHY
 # =============================================================================
 
-MODERN_FONTS = [
-    {"name": "Inter", "weights": [400, 500, 600, 700, 800, 900], "style": "modern"},
-    {"name": "Montserrat", "weights": [400, 600, 700, 800, 900], "style": "bold"},
-    {"name": "Playfair Display", "weights": [400, 600, 700, 900], "style": "elegant"},
-    {"name": "Poppins", "weights": [400, 500, 600, 700, 800], "style": "friendly"},
-    {"name": "Bebas Neue", "weights": [400], "style": "impact"},
-    {"name": "Space Grotesk", "weights": [400, 500, 600, 700], "style": "tech"},
-]
+class Font(NamedTuple):
+    """Font family with its available weights"""
+    name: str
+    weights: Tuple[int, ...]
+    style: str
+
+MODERN_FONTS = (
+    Font("Inter", (400, 500, 600, 700, 800, 900), "modern"),
+    Font("Montserrat", (400, 600, 700, 800, 900), "bold"),
+    Font("Playfair Display", (400, 600, 700, 900), "elegant"),
+    Font("Poppins", (400, 500, 600, 700, 800), "friendly"),
+    Font("Bebas Neue", (400,), "impact"),
+    Font("Space Grotesk", (400, 500, 600, 700), "tech"),
+)
 
 # =============================================================================
 # VISUAL EFFECTS & DECORATIONS
 # =============================================================================
 
-def generate_modern_decorations(color_scheme: Dict, layout_name: str, format_size: tuple) -> List[Dict]:
-    """Generate modern visual decorations"""
-    decorations = []
-    width, height = format_size
+# Candidate decorations, built once at import; callers get copies
+_DECORATION_SHAPES = (
+    # Corner accents
+    {"type": "circle", "x": -5, "y": -5, "w": 20, "h": 20, "opacity": 0.15, "blur": 30},
+    {"type": "circle", "x": 90, "y": 88, "w": 25, "h": 25, "opacity": 0.12, "blur": 40},
     
-    # Geometric shapes
-    shapes = [
-        # Corner accents
-        {"type": "circle", "x": -5, "y": -5, "w": 20, "h": 20, "opacity": 0.15, "blur": 30},
-        {"type": "circle", "x": 90, "y": 88, "w": 25, "h": 25, "opacity": 0.12, "blur": 40},
-        
-        # Grid lines (subtle)
-        {"type": "line", "x": 10, "y": 0, "w": 0.2, "h": 100, "opacity": 0.05},
-        {"type": "line", "x": 90, "y": 0, "w": 0.2, "h": 100, "opacity": 0.05},
-        
-        # Floating elements
-        {"type": "rect", "x": 75, "y": 15, "w": 18, "h": 18, "opacity": 0.08, "rotation": 45},
-        {"type": "circle", "x": 8, "y": 70, "w": 12, "h": 12, "opacity": 0.1},
-        
-        # Pattern overlay
-        {"type": "dots_pattern", "opacity": 0.03},
-    ]
+    # Grid lines (subtle)
+    {"type": "line", "x": 10, "y": 0, "w": 0.2, "h": 100, "opacity": 0.05},
+    {"type": "line", "x": 90, "y": 0, "w": 0.2, "h": 100, "opacity": 0.05},
     
-    # Randomly select 3-5 decorations
-    selected = random.sample(shapes[:6], k=random.randint(3, 5))
-    return selected
+    # Floating elements
+    {"type": "rect", "x": 75, "y": 15, "w": 18, "h": 18, "opacity": 0.08, "rotation": 45},
+    {"type": "circle", "x": 8, "y": 70, "w": 12, "h": 12, "opacity": 0.1},
+)
+
+# The trailing underscore parameters bind the RNG at definition time so each
+# call uses fast local lookups; callers never pass them.
+def generate_modern_decorations(color_scheme: Dict, layout_name: str, format_size: tuple,
+                                _sample=random.sample, _randint=random.randint) -> List[Dict]:
+    """Generate modern visual decorations"""
+    return generate_modern_decorations_batch(1, _sample, _randint)[0]
+
+def generate_modern_decorations_batch(n: int, _sample=random.sample,
+                                      _randint=random.randint) -> List[List[Dict]]:
+    """Generate decorations for n designs in one call"""
+    # Randomly select 3-5 decorations per design
+    return [[dict(shape) for shape in _sample(_DECORATION_SHAPES, k=_randint(3, 5))]
+            for _ in range(n)]
 
 # =============================================================================
 # ENHANCED CONTENT GENERATION
 # =============================================================================
 
 MODERN_HEADLINES = {
-    "tech": [
+    "tech": (
         "Transform Your Tomorrow",
         "Innovation Starts Here",
         "Power Your Vision",
@@ -224,103 +269,103 @@ MODERN_HEADLINES = {
         "Elevate Your Experience",
         "Where Ideas Come Alive",
         "Redefine Possible"
-    ],
-    "sale": [
+    ),
+    "sale": (
         "Unmissable Deals Inside",
         "Your Best Price Ever",
         "Shop Smarter, Save Bigger",
         "Limited Time Magic",
         "The Sale You've Waited For",
         "Exclusive Offers Await"
-    ],
-    "fashion": [
+    ),
+    "fashion": (
         "Style Redefined",
         "Wear Your Confidence",
         "Elegance Meets Edge",
         "Your Signature Look",
         "Fashion Forward",
         "Curated for You"
-    ],
-    "fitness": [
+    ),
+    "fitness": (
         "Unleash Your Strength",
         "Transform Your Body",
         "Be Unstoppable",
         "Your Journey Begins",
         "Power Through Limits",
         "Achieve the Extraordinary"
-    ],
-    "food": [
+    ),
+    "food": (
         "Taste the Difference",
         "Flavor Beyond Imagination",
         "Fresh. Bold. Delicious.",
         "Your Next Craving",
         "Culinary Excellence",
         "Savor Every Moment"
-    ],
-    "business": [
+    ),
+    "business": (
         "Success Delivered",
         "Your Growth Partner",
         "Results That Matter",
         "Excellence in Action",
         "Strategic Solutions",
         "Empowering Your Success"
-    ],
-    "default": [
+    ),
+    "default": (
         "Experience the Difference",
         "Your Perfect Choice",
         "Discover Something Amazing",
         "Make It Happen",
         "Join the Movement",
         "Start Your Journey"
-    ]
+    )
 }
 
 MODERN_SUBHEADLINES = {
-    "tech": [
+    "tech": (
         "Powered by cutting-edge technology",
         "Join 100,000+ innovators worldwide",
         "The future is now, and it's yours",
         "Transform how you work and create"
-    ],
-    "sale": [
+    ),
+    "sale": (
         "Up to 70% off your favorite brands",
         "Free shipping on all orders today",
         "Limited stock • Shop before it's gone",
         "Exclusive member pricing unlocked"
-    ],
-    "fashion": [
+    ),
+    "fashion": (
         "New collection • Limited edition",
         "Handpicked styles just for you",
         "From runway to your wardrobe",
         "Timeless pieces, modern prices"
-    ],
-    "fitness": [
+    ),
+    "fitness": (
         "Proven results in 30 days",
         "Train with champion athletes",
         "Your personalized fitness journey",
         "Science-backed, results-driven"
-    ],
-    "food": [
+    ),
+    "food": (
         "Made fresh daily with love",
         "Farm-to-table quality guaranteed",
         "Award-winning flavors await",
         "Local ingredients, global inspiration"
-    ],
-    "business": [
+    ),
+    "business": (
         "Trusted by industry leaders",
         "Scale faster, work smarter",
         "ROI guaranteed or money back",
         "Join 50,000+ successful companies"
-    ],
-    "default": [
+    ),
+    "default": (
         "Limited time offer • Act now",
         "Join thousands of happy customers",
         "Quality you can trust",
         "Get started in minutes"
-    ]
+    )
 }
 
-MODERN_CTAS = [
+MODERN_CTAS = (
     "Get Started Free",
     "Shop Now",
     "Learn More",
@@ -333,23 +378,27 @@ MODERN_CTAS = [
     "See How It Works",
     "Try Risk-Free",
     "Unlock Access"
-]
+)
+
+# Category keywords in priority order: when a prompt mentions several
+# categories, the one listed first wins.
+_CATEGORY_KEYWORDS = (
+    ('tech', ('tech', 'ai', 'software', 'app', 'digital', 'startup')),
+    ('sale', ('sale', 'discount', 'offer', 'deal', 'save')),
+    ('fashion', ('fashion', 'clothing', 'wear', 'style', 'outfit')),
+    ('fitness', ('fitness', 'gym', 'workout', 'health', 'exercise')),
+    ('food', ('food', 'restaurant', 'cafe', 'meal', 'recipe')),
+    ('business', ('business', 'corporate', 'company', 'enterprise')),
+)
 
+@lru_cache(maxsize=1024)
 def detect_category(prompt: str) -> str:
     """Detect category from prompt"""
     prompt_lower = prompt.lower()
     
-    if any(word in prompt_lower for word in ['tech', 'ai', 'software', 'app', 'digital', 'startup']):
-        return 'tech'
-    elif any(word in prompt_lower for word in ['sale', 'discount', 'offer', 'deal', 'save']):
-        return 'sale'
-    elif any(word in prompt_lower for word in ['fashion', 'clothing', 'wear', 'style', 'outfit']):
-        return 'fashion'
-    elif any(word in prompt_lower for word in ['fitness', 'gym', 'workout', 'health', 'exercise']):
-        return 'fitness'
-    elif any(word in prompt_lower for word in ['food', 'restaurant', 'cafe', 'meal', 'recipe']):
-        return 'food'
-    elif any(word in prompt_lower for word in ['business', 'corporate', 'company', 'enterprise']):
-        return 'business'
+    for category, keywords in _CATEGORY_KEYWORDS:
+        for word in keywords:
+            if word in prompt_lower:
+                return category
     
     return 'default'
@@ -2,157 +2,197 @@
 Professional Poster Templates - Canva-like High-Quality Designs
 """
 
-import random
 import re
-from typing import Dict, List, Any
+import zlib
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Any, NamedTuple, Optional, Tuple
+
+
+class Palette(NamedTuple):
+    """Poster color palette; background is a CSS color or gradient"""
+    background: str
+    primary: str
+    secondary: str
+    text: str
+    accent: str
+    muted: str
+
+
+class FontCombo(NamedTuple):
+    """Font families for a poster's text tiers"""
+    heading: str
+    subheading: str
+    body: str
+
+
+class Template(NamedTuple):
+    """Gallery entry naming the palette, layout and fonts a template uses"""
+    id: str
+    name: str
+    category: str
+    preview_prompt: str
+    palette: str
+    layout: str
+    fonts: str
+
 
 # Professional Color Palettes
-COLOR_PALETTES = {
-    "tech_dark": {
-        "background": "linear-gradient(135deg, #0f0f1a 0%, #1a1a2e 50%, #16213e 100%)",
-        "primary": "#3b82f6",
-        "secondary": "#60a5fa",
-        "text": "#ffffff",
-        "accent": "#818cf8",
-        "muted": "#94a3b8"
-    },
-    "tech_light": {
-        "background": "linear-gradient(180deg, #f0f9ff 0%, #e0f2fe 100%)",
-        "primary": "#0284c7",
-        "secondary": "#0ea5e9",
-        "text": "#0c4a6e",
-        "accent": "#06b6d4",
-        "muted": "#64748b"
-    },
-    "fashion_vibrant": {
-        "background": "linear-gradient(135deg, #ff6b9d 0%, #ff8fab 50%, #ffc2d1 100%)",
-        "primary": "#ffffff",
-        "secondary": "#ffe66d",
-        "text": "#ffffff",
-        "accent": "#ff1744",
-        "muted": "#ffc2d1"
-    },
-    "fashion_minimal": {
-        "background": "#faf5f0",
-        "primary": "#1a1a1a",
-        "secondary": "#8b7355",
-        "text": "#1a1a1a",
-        "accent": "#d4a574",
-        "muted": "#a89984"
-    },
-    "sale_urgent": {
-        "background": "linear-gradient(135deg, #dc2626 0%, #ef4444 50%, #f87171 100%)",
-        "primary": "#fbbf24",
-        "secondary": "#ffffff",
-        "text": "#ffffff",
-        "accent": "#fef08a",
-        "muted": "#fca5a5"
-    },
-    "sale_black_friday": {
-        "background": "#000000",
-        "primary": "#fbbf24",
-        "secondary": "#f59e0b",
-        "text": "#ffffff",
-        "accent": "#ef4444",
-        "muted": "#71717a"
-    },
-    "business_corporate": {
-        "background": "linear-gradient(180deg, #1e3a5f 0%, #0a1929 100%)",
-        "primary": "#fbbf24",
-        "secondary": "#ffffff",
-        "text": "#ffffff",
-        "accent": "#3b82f6",
-        "muted": "#94a3b8"
-    },
-    "business_modern": {
-        "background": "#ffffff",
-        "primary": "#1e40af",
-        "secondary": "#3b82f6",
-        "text": "#1e293b",
-        "accent": "#06b6d4",
-        "muted": "#64748b"
-    },
-    "food_warm": {
-        "background": "linear-gradient(180deg, #fef3c7 0%, #fde68a 100%)",
-        "primary": "#ef4444",
-        "secondary": "#f97316",
-        "text": "#78350f",
-        "accent": "#22c55e",
-        "muted": "#92400e"
-    },
-    "food_fresh": {
-        "background": "linear-gradient(135deg, #dcfce7 0%, #bbf7d0 100%)",
-        "primary": "#16a34a",
-        "secondary": "#22c55e",
-        "text": "#14532d",
-        "accent": "#f97316",
-        "muted": "#166534"
-    },
-    "wellness_calm": {
-        "background": "linear-gradient(180deg, #f0fdf4 0%, #dcfce7 50%, #bbf7d0 100%)",
-        "primary": "#059669",
-        "secondary": "#10b981",
-        "text": "#064e3b",
-        "accent": "#f59e0b",
-        "muted": "#6b7280"
-    },
-    "luxury_gold": {
-        "background": "linear-gradient(135deg, #1a1a1a 0%, #2d2d2d 100%)",
-        "primary": "#d4af37",
-        "secondary": "#ffd700",
-        "text": "#ffffff",
-        "accent": "#b8860b",
-        "muted": "#a3a3a3"
-    },
-    "creative_gradient": {
-        "background": "linear-gradient(135deg, #667eea 0%, #764ba2 50%, #f093fb 100%)",
-        "primary": "#ffffff",
-        "secondary": "#fef08a",
-        "text": "#ffffff",
-        "accent": "#22d3ee",
-        "muted": "#c4b5fd"
-    },
-    "minimalist_clean": {
-        "background": "#ffffff",
-        "primary": "#18181b",
-        "secondary": "#3f3f46",
-        "text": "#18181b",
-        "accent": "#ef4444",
-        "muted": "#a1a1aa"
-    },
-    "event_party": {
-        "background": "linear-gradient(135deg, #7c3aed 0%, #a855f7 50%, #d946ef 100%)",
-        "primary": "#ffffff",
-        "secondary": "#fef08a",
-        "text": "#ffffff",
-        "accent": "#22d3ee",
-        "muted": "#c4b5fd"
-    },
-    "education_bright": {
-        "background": "linear-gradient(180deg, #dbeafe 0%, #bfdbfe 100%)",
-        "primary": "#1d4ed8",
-        "secondary": "#3b82f6",
-        "text": "#1e3a8a",
-        "accent": "#f59e0b",
-        "muted": "#6b7280"
-    }
-}
+COLOR_PALETTES = MappingProxyType({
+    "tech_dark": Palette(
+        background="linear-gradient(135deg, #0f0f1a 0%, #1a1a2e 50%, #16213e 100%)",
+        primary="#3b82f6",
+        secondary="#60a5fa",
+        text="#ffffff",
+        accent="#818cf8",
+        muted="#94a3b8"
+    ),
+    "tech_light": Palette(
+        background="linear-gradient(180deg, #f0f9ff 0%, #e0f2fe 100%)",
+        primary="#0284c7",
+        secondary="#0ea5e9",
+        text="#0c4a6e",
+        accent="#06b6d4",
+        muted="#64748b"
+    ),
+    "fashion_vibrant": Palette(
+        background="linear-gradient(135deg, #ff6b9d 0%, #ff8fab 50%, #ffc2d1 100%)",
+        primary="#ffffff",
+        secondary="#ffe66d",
+        text="#ffffff",
+        accent="#ff1744",
+        muted="#ffc2d1"
+    ),
+    "fashion_minimal": Palette(
+        background="#faf5f0",
+        primary="#1a1a1a",
+        secondary="#8b7355",
+        text="#1a1a1a",
+        accent="#d4a574",
+        muted="#a89984"
+    ),
+    "sale_urgent": Palette(
+        background="linear-gradient(135deg, #dc2626 0%, #ef4444 50%, #f87171 100%)",
+        primary="#fbbf24",
+        secondary="#ffffff",
+        text="#ffffff",
+        accent="#fef08a",
+        muted="#fca5a5"
+    ),
+    "sale_black_friday": Palette(
+        background="#000000",
+        primary="#fbbf24",
+        secondary="#f59e0b",
+        text="#ffffff",
+        accent="#ef4444",
+        muted="#71717a"
+    ),
+    "business_corporate": Palette(
+        background="linear-gradient(180deg, #1e3a5f 0%, #0a1929 100%)",
+        primary="#fbbf24",
+        secondary="#ffffff",
+        text="#ffffff",
+        accent="#3b82f6",
+        muted="#94a3b8"
+    ),
+    "business_modern": Palette(
+        background="#ffffff",
+        primary="#1e40af",
+        secondary="#3b82f6",
+        text="#1e293b",
+        accent="#06b6d4",
+        muted="#64748b"
+    ),
+    "food_warm": Palette(
+        background="linear-gradient(180deg, #fef3c7 0%, #fde68a 100%)",
+        primary="#ef4444",
+        secondary="#f97316",
+        text="#78350f",
+        accent="#22c55e",
+        muted="#92400e"
+    ),
+    "food_fresh": Palette(
+        background="linear-gradient(135deg, #dcfce7 0%, #bbf7d0 100%)",
+        primary="#16a34a",
+        secondary="#22c55e",
+        text="#14532d",
+        accent="#f97316",
+        muted="#166534"
+    ),
+    "wellness_calm": Palette(
+        background="linear-gradient(180deg, #f0fdf4 0%, #dcfce7 50%, #bbf7d0 100%)",
+        primary="#059669",
+        secondary="#10b981",
+        text="#064e3b",
+        accent="#f59e0b",
+        muted="#6b7280"
+    ),
+    "luxury_gold": Palette(
+        background="linear-gradient(135deg, #1a1a1a 0%, #2d2d2d 100%)",
+        primary="#d4af37",
+        secondary="#ffd700",
+        text="#ffffff",
+        accent="#b8860b",
+        muted="#a3a3a3"
+    ),
+    "creative_gradient": Palette(
+        background="linear-gradient(135deg, #667eea 0%, #764ba2 50%, #f093fb 100%)",
+        primary="#ffffff",
+        secondary="#fef08a",
+        text="#ffffff",
+        accent="#22d3ee",
+        muted="#c4b5fd"
+    ),
+    "minimalist_clean": Palette(
+        background="#ffffff",
+        primary="#18181b",
+        secondary="#3f3f46",
+        text="#18181b",
+        accent="#ef4444",
+        muted="#a1a1aa"
+    ),
+    "event_party": Palette(
+        background="linear-gradient(135deg, #7c3aed 0%, #a855f7 50%, #d946ef 100%)",
+        primary="#ffffff",
+        secondary="#fef08a",
+        text="#ffffff",
+        accent="#22d3ee",
+        muted="#c4b5fd"
+    ),
+    "education_bright": Palette(
+        background="linear-gradient(180deg, #dbeafe 0%, #bfdbfe 100%)",
+        primary="#1d4ed8",
+        secondary="#3b82f6",
+        text="#1e3a8a",
+        accent="#f59e0b",
+        muted="#6b7280"
+    )
+})
 
 # Professional Font Combinations
-FONT_COMBOS = {
-    "modern": {"heading": "Montserrat", "subheading": "Inter", "body": "Inter"},
-    "classic": {"heading": "Playfair Display", "subheading": "Lora", "body": "Georgia"},
-    "bold": {"heading": "Anton", "subheading": "Roboto", "body": "Roboto"},
-    "elegant": {"heading": "Cormorant Garamond", "subheading": "Raleway", "body": "Raleway"},
-    "tech": {"heading": "Space Grotesk", "subheading": "DM Sans", "body": "DM Sans"},
-    "fun": {"heading": "Bebas Neue", "subheading": "Poppins", "body": "Poppins"},
-    "minimal": {"heading": "Helvetica Neue", "subheading": "Arial", "body": "Arial"},
-    "luxury": {"heading": "Didot", "subheading": "Futura", "body": "Futura"},
-}
+FONT_COMBOS = MappingProxyType({
+    "modern": FontCombo(heading="Montserrat", subheading="Inter", body="Inter"),
+    "classic": FontCombo(heading="Playfair Display", subheading="Lora", body="Georgia"),
+    "bold": FontCombo(heading="Anton", subheading="Roboto", body="Roboto"),
+    "elegant": FontCombo(heading="Cormorant Garamond", subheading="Raleway", body="Raleway"),
+    "tech": FontCombo(heading="Space Grotesk", subheading="DM Sans", body="DM Sans"),
+    "fun": FontCombo(heading="Bebas Neue", subheading="Poppins", body="Poppins"),
+    "minimal": FontCombo(heading="Helvetica Neue", subheading="Arial", body="Arial"),
+    "luxury": FontCombo(heading="Didot", subheading="Futura", body="Futura"),
+})
 
 # Layout Templates
-def create_hero_layout(width: int, height: int, palette: Dict, fonts: Dict, content: Dict) -> List[Dict]:
+def create_hero_layout(width: int, height: int, palette: Palette, fonts: FontCombo, content: Dict) -> List[Dict]:
     """Hero layout with big headline at center"""
+    primary = palette.primary
+    accent = palette.accent
+    text_color = palette.text
+    muted = palette.muted
+    heading_font = fonts.heading
+    subheading_font = fonts.subheading
+    body_font = fonts.body
+    circle_size = width * 0.4
+    
     elements = []
     
     # Decorative shape top
@@ -160,9 +200,9 @@ def create_hero_layout(width: int, height: int, palette: Dict, fonts: Dict, cont
         "type": "circle",
         "x": width * 0.8,
         "y": -height * 0.1,
-        "width": width * 0.4,
-        "height": width * 0.4,
-        "color": palette["accent"],
+        "width": circle_size,
+        "height": circle_size,
+        "color": accent,
         "opacity": 0.3
     })
     
@@ -174,8 +214,8 @@ def create_hero_layout(width: int, height: int, palette: Dict, fonts: Dict, cont
         "y": height * 0.28,
         "width": width * 0.84,
         "fontSize": int(width * 0.085),
-        "color": palette["text"],
-        "fontFamily": fonts["heading"],
+        "color": text_color,
+        "fontFamily": heading_font,
         "fontWeight": "bold",
         "textAlign": "center",
         "lineHeight": 1.1
@@ -189,8 +229,8 @@ def create_hero_layout(width: int, height: int, palette: Dict, fonts: Dict, cont
         "y": height * 0.48,
         "width": width * 0.8,
         "fontSize": int(width * 0.032),
-        "color": palette["muted"],
-        "fontFamily": fonts["subheading"],
+        "color": muted,
+        "fontFamily": subheading_font,
         "fontWeight": "normal",
         "textAlign": "center",
         "lineHeight": 1.4
@@ -208,7 +248,7 @@ def create_hero_layout(width: int, height: int, palette: Dict, fonts: Dict, cont
         "y": btn_y,
         "width": btn_width,
         "height": btn_height,
-        "color": palette["primary"],
+        "color": primary,
         "borderRadius": 8,
         "shadow": True
     })
@@ -220,8 +260,8 @@ def create_hero_layout(width: int, height: int, palette: Dict, fonts: Dict, cont
         "y": btn_y + btn_height * 0.25,
         "width": btn_width,
         "fontSize": int(width * 0.028),
-        "color": "#ffffff" if palette["primary"] != "#ffffff" else "#000000",
-        "fontFamily": fonts["body"],
+        "color": "#ffffff" if primary != "#ffffff" else "#000000",
+        "fontFamily": body_font,
         "fontWeight": "600",
         "textAlign": "center"
     })
@@ -234,8 +274,8 @@ def create_hero_layout(width: int, height: int, palette: Dict, fonts: Dict, cont
         "y": height * 0.82,
         "width": width * 0.3,
         "fontSize": int(width * 0.035),
-        "color": palette["muted"],
-        "fontFamily": fonts["heading"],
+        "color": muted,
+        "fontFamily": heading_font,
         "fontWeight": "bold",
         "textAlign": "center",
         "letterSpacing": 4
@@ -244,8 +284,19 @@ def create_hero_layout(width: int, height: int, palette: Dict, fonts: Dict, cont
     return elements
 
 
-def create_split_layout(width: int, height: int, palette: Dict, fonts: Dict, content: Dict) -> List[Dict]:
+def create_split_layout(width: int, height: int, palette: Palette, fonts: FontCombo, content: Dict) -> List[Dict]:
     """Split layout - left text, right decorative"""
+    primary = palette.primary
+    secondary = palette.secondary
+    accent = palette.accent
+    text_color = palette.text
+    muted = palette.muted
+    heading_font = fonts.heading
+    body_font = fonts.body
+    margin_x = width * 0.05
+    large_circle = width * 0.25
+    small_circle = width * 0.15
+    
     elements = []
     
     # Right side accent block
@@ -255,7 +306,7 @@ def create_split_layout(width: int, height: int, palette: Dict, fonts: Dict, con
         "y": 0,
         "width": width * 0.45,
         "height": height,
-        "color": palette["primary"],
+        "color": primary,
         "opacity": 0.9
     })
     
@@ -264,9 +315,9 @@ def create_split_layout(width: int, height: int, palette: Dict, fonts: Dict, con
         "type": "circle",
         "x": width * 0.65,
         "y": height * 0.2,
-        "width": width * 0.25,
-        "height": width * 0.25,
-        "color": palette["accent"],
+        "width": large_circle,
+        "height": large_circle,
+        "color": accent,
         "opacity": 0.5
     })
     
@@ -274,9 +325,9 @@ def create_split_layout(width: int, height: int, palette: Dict, fonts: Dict, con
         "type": "circle",
         "x": width * 0.75,
         "y": height * 0.55,
-        "width": width * 0.15,
-        "height": width * 0.15,
-        "color": palette["secondary"],
+        "width": small_circle,
+        "height": small_circle,
+        "color": secondary,
         "opacity": 0.6
     })
     
@@ -284,12 +335,12 @@ def create_split_layout(width: int, height: int, palette: Dict, fonts: Dict, con
     elements.append({
         "type": "textbox",
         "text": content.get("tag", "FEATURED"),
-        "x": width * 0.05,
+        "x": margin_x,
         "y": height * 0.12,
         "width": width * 0.4,
         "fontSize": int(width * 0.022),
-        "color": palette["accent"],
-        "fontFamily": fonts["body"],
+        "color": accent,
+        "fontFamily": body_font,
         "fontWeight": "600",
         "letterSpacing": 3
     })
@@ -298,12 +349,12 @@ def create_split_layout(width: int, height: int, palette: Dict, fonts: Dict, con
     elements.append({
         "type": "textbox",
         "text": content.get("headline", "Make Your\nMark"),
-        "x": width * 0.05,
+        "x": margin_x,
         "y": height * 0.2,
         "width": width * 0.48,
         "fontSize": int(width * 0.075),
-        "color": palette["text"],
-        "fontFamily": fonts["heading"],
+        "color": text_color,
+        "fontFamily": heading_font,
         "fontWeight": "bold",
         "lineHeight": 1.05
     })
@@ -312,38 +363,39 @@ def create_split_layout(width: int, height: int, palette: Dict, fonts: Dict, con
     elements.append({
         "type": "textbox",
         "text": content.get("description", "Transform your ideas into reality with our powerful platform."),
-        "x": width * 0.05,
+        "x": margin_x,
         "y": height * 0.52,
         "width": width * 0.45,
         "fontSize": int(width * 0.026),
-        "color": palette["muted"],
-        "fontFamily": fonts["body"],
+        "color": muted,
+        "fontFamily": body_font,
         "lineHeight": 1.5
     })
     
     # CTA Button
     btn_width = width * 0.28
     btn_height = height * 0.065
+    btn_y = height * 0.72
     
     elements.append({
         "type": "rect",
-        "x": width * 0.05,
-        "y": height * 0.72,
+        "x": margin_x,
+        "y": btn_y,
         "width": btn_width,
         "height": btn_height,
-        "color": palette["primary"],
+        "color": primary,
         "borderRadius": 6
     })
     
     elements.append({
         "type": "textbox",
         "text": content.get("cta", "Learn More"),
-        "x": width * 0.05,
-        "y": height * 0.72 + btn_height * 0.28,
+        "x": margin_x,
+        "y": btn_y + btn_height * 0.28,
         "width": btn_width,
         "fontSize": int(width * 0.024),
         "color": "#ffffff",
-        "fontFamily": fonts["body"],
+        "fontFamily": body_font,
         "fontWeight": "600",
         "textAlign": "center"
     })
@@ -352,12 +404,12 @@ def create_split_layout(width: int, height: int, palette: Dict, fonts: Dict, con
     elements.append({
         "type": "textbox",
         "text": content.get("brand", "BRAND"),
-        "x": width * 0.05,
+        "x": margin_x,
         "y": height * 0.88,
         "width": width * 0.3,
         "fontSize": int(width * 0.028),
-        "color": palette["muted"],
-        "fontFamily": fonts["heading"],
+        "color": muted,
+        "fontFamily": heading_font,
         "fontWeight": "bold",
         "letterSpacing": 2
     })
@@ -365,8 +417,14 @@ def create_split_layout(width: int, height: int, palette: Dict, fonts: Dict, con
     return elements
 
 
-def create_sale_layout(width: int, height: int, palette: Dict, fonts: Dict, content: Dict) -> List[Dict]:
+def create_sale_layout(width: int, height: int, palette: Palette, fonts: FontCombo, content: Dict) -> List[Dict]:
     """Bold sale/discount layout"""
+    primary = palette.primary
+    text_color = palette.text
+    muted = palette.muted
+    heading_font = fonts.heading
+    body_font = fonts.body
+    
     elements = []
     
     # Top banner stripe
@@ -376,7 +434,7 @@ def create_sale_layout(width: int, height: int, palette: Dict, fonts: Dict, cont
         "y": 0,
         "width": width,
         "height": height * 0.12,
-        "color": palette["primary"]
+        "color": primary
     })
     
     elements.append({
@@ -386,8 +444,8 @@ def create_sale_layout(width: int, height: int, palette: Dict, fonts: Dict, cont
         "y": height * 0.035,
         "width": width,
         "fontSize": int(width * 0.028),
-        "color": palette["text"] if palette["primary"] == "#fbbf24" else "#000000",
-        "fontFamily": fonts["body"],
+        "color": text_color if primary == "#fbbf24" else "#000000",
+        "fontFamily": body_font,
         "fontWeight": "bold",
         "textAlign": "center",
         "letterSpacing": 2
@@ -401,8 +459,8 @@ def create_sale_layout(width: int, height: int, palette: Dict, fonts: Dict, cont
         "y": height * 0.18,
         "width": width,
         "fontSize": int(width * 0.22),
-        "color": palette["primary"],
-        "fontFamily": fonts["heading"],
+        "color": primary,
+        "fontFamily": heading_font,
         "fontWeight": "bold",
         "textAlign": "center"
     })
@@ -414,8 +472,8 @@ def create_sale_layout(width: int, height: int, palette: Dict, fonts: Dict, cont
         "y": height * 0.42,
         "width": width,
         "fontSize": int(width * 0.1),
-        "color": palette["text"],
-        "fontFamily": fonts["heading"],
+        "color": text_color,
+        "fontFamily": heading_font,
         "fontWeight": "bold",
         "textAlign": "center"
     })
@@ -428,8 +486,8 @@ def create_sale_layout(width: int, height: int, palette: Dict, fonts: Dict, cont
         "y": height * 0.56,
         "width": width,
         "fontSize": int(width * 0.072),
-        "color": palette["text"],
-        "fontFamily": fonts["heading"],
+        "color": text_color,
+        "fontFamily": heading_font,
         "fontWeight": "bold",
         "textAlign": "center",
         "letterSpacing": 4
@@ -443,8 +501,8 @@ def create_sale_layout(width: int, height: int, palette: Dict, fonts: Dict, cont
         "y": height * 0.68,
         "width": width * 0.8,
         "fontSize": int(width * 0.028),
-        "color": palette["muted"],
-        "fontFamily": fonts["body"],
+        "color": muted,
+        "fontFamily": body_font,
         "textAlign": "center"
     })
     
@@ -452,14 +510,15 @@ def create_sale_layout(width: int, height: int, palette: Dict, fonts: Dict, cont
     btn_width = width * 0.5
     btn_height = height * 0.08
     btn_x = (width - btn_width) / 2
+    btn_y = height * 0.78
     
     elements.append({
         "type": "rect",
         "x": btn_x,
-        "y": height * 0.78,
+        "y": btn_y,
         "width": btn_width,
         "height": btn_height,
-        "color": palette["primary"],
+        "color": primary,
         "borderRadius": 8
     })
     
@@ -467,11 +526,11 @@ def create_sale_layout(width: int, height: int, palette: Dict, fonts: Dict, cont
         "type": "textbox",
         "text": content.get("cta", "SHOP NOW"),
         "x": btn_x,
-        "y": height * 0.78 + btn_height * 0.25,
+        "y": btn_y + btn_height * 0.25,
         "width": btn_width,
         "fontSize": int(width * 0.032),
-        "color": "#000000" if palette["primary"] == "#fbbf24" else "#ffffff",
-        "fontFamily": fonts["body"],
+        "color": "#000000" if primary == "#fbbf24" else "#ffffff",
+        "fontFamily": body_font,
         "fontWeight": "bold",
         "textAlign": "center"
     })
@@ -484,8 +543,8 @@ def create_sale_layout(width: int, height: int, palette: Dict, fonts: Dict, cont
         "y": height * 0.92,
         "width": width,
         "fontSize": int(width * 0.025),
-        "color": palette["muted"],
-        "fontFamily": fonts["heading"],
+        "color": muted,
+        "fontFamily": heading_font,
         "textAlign": "center",
         "letterSpacing": 3
     })
@@ -493,30 +552,38 @@ def create_sale_layout(width: int, height: int, palette: Dict, fonts: Dict, cont
     return elements
 
 
-def create_minimal_layout(width: int, height: int, palette: Dict, fonts: Dict, content: Dict) -> List[Dict]:
+def create_minimal_layout(width: int, height: int, palette: Palette, fonts: FontCombo, content: Dict) -> List[Dict]:
     """Clean minimal layout"""
+    primary = palette.primary
+    accent = palette.accent
+    text_color = palette.text
+    muted = palette.muted
+    heading_font = fonts.heading
+    body_font = fonts.body
+    margin_x = width * 0.1
+    
     elements = []
     
     # Thin accent line
     elements.append({
         "type": "rect",
-        "x": width * 0.1,
+        "x": margin_x,
         "y": height * 0.25,
         "width": width * 0.15,
         "height": 4,
-        "color": palette["accent"]
+        "color": accent
     })
     
     # Main headline
     elements.append({
         "type": "textbox",
         "text": content.get("headline", "Less is More"),
-        "x": width * 0.1,
+        "x": margin_x,
         "y": height * 0.3,
         "width": width * 0.8,
         "fontSize": int(width * 0.08),
-        "color": palette["text"],
-        "fontFamily": fonts["heading"],
+        "color": text_color,
+        "fontFamily": heading_font,
         "fontWeight": "bold",
         "lineHeight": 1.1
     })
@@ -525,12 +592,12 @@ def create_minimal_layout(width: int, height: int, palette: Dict, fonts: Dict, c
     elements.append({
         "type": "textbox",
         "text": content.get("subheadline", "Embrace simplicity in design"),
-        "x": width * 0.1,
+        "x": margin_x,
         "y": height * 0.5,
         "width": width * 0.7,
         "fontSize": int(width * 0.032),
-        "color": palette["muted"],
-        "fontFamily": fonts["body"],
+        "color": muted,
+        "fontFamily": body_font,
         "lineHeight": 1.5
     })
     
@@ -538,23 +605,23 @@ def create_minimal_layout(width: int, height: int, palette: Dict, fonts: Dict, c
     elements.append({
         "type": "textbox",
         "text": content.get("cta", "Discover →"),
-        "x": width * 0.1,
+        "x": margin_x,
         "y": height * 0.68,
         "width": width * 0.5,
         "fontSize": int(width * 0.028),
-        "color": palette["primary"],
-        "fontFamily": fonts["body"],
+        "color": primary,
+        "fontFamily": body_font,
         "fontWeight": "600"
     })
     
     # Bottom line
     elements.append({
         "type": "rect",
-        "x": width * 0.1,
+        "x": margin_x,
         "y": height * 0.85,
         "width": width * 0.8,
         "height": 1,
-        "color": palette["muted"],
+        "color": muted,
         "opacity": 0.3
     })
     
@@ -562,12 +629,12 @@ def create_minimal_layout(width: int, height: int, palette: Dict, fonts: Dict, c
     elements.append({
         "type": "textbox",
         "text": content.get("brand", "BRAND"),
-        "x": width * 0.1,
+        "x": margin_x,
         "y": height * 0.88,
         "width": width * 0.3,
         "fontSize": int(width * 0.022),
-        "color": palette["muted"],
-        "fontFamily": fonts["heading"],
+        "color": muted,
+        "fontFamily": heading_font,
         "fontWeight": "bold",
         "letterSpacing": 3
     })
@@ -575,8 +642,16 @@ def create_minimal_layout(width: int, height: int, palette: Dict, fonts: Dict, c
     return elements
 
 
-def create_story_layout(width: int, height: int, palette: Dict, fonts: Dict, content: Dict) -> List[Dict]:
+def create_story_layout(width: int, height: int, palette: Palette, fonts: FontCombo, content: Dict) -> List[Dict]:
     """Story format (9:16) optimized layout"""
+    primary = palette.primary
+    accent = palette.accent
+    text_color = palette.text
+    muted = palette.muted
+    heading_font = fonts.heading
+    body_font = fonts.body
+    circle_size = width * 0.7
+    
     elements = []
     
     # Top gradient overlay effect
@@ -586,7 +661,7 @@ def create_story_layout(width: int, height: int, palette: Dict, fonts: Dict, con
         "y": 0,
         "width": width,
         "height": height * 0.3,
-        "gradient": f"linear-gradient(180deg, {palette['primary']}40 0%, transparent 100%)"
+        "gradient": f"linear-gradient(180deg, {primary}40 0%, transparent 100%)"
     })
     
     # Brand at top
@@ -597,8 +672,8 @@ def create_story_layout(width: int, height: int, palette: Dict, fonts: Dict, con
         "y": height * 0.05,
         "width": width,
         "fontSize": int(width * 0.045),
-        "color": palette["text"],
-        "fontFamily": fonts["heading"],
+        "color": text_color,
+        "fontFamily": heading_font,
         "fontWeight": "bold",
         "textAlign": "center",
         "letterSpacing": 4
@@ -609,9 +684,9 @@ def create_story_layout(width: int, height: int, palette: Dict, fonts: Dict, con
         "type": "circle",
         "x": width * 0.15,
         "y": height * 0.25,
-        "width": width * 0.7,
-        "height": width * 0.7,
-        "color": palette["accent"],
+        "width": circle_size,
+        "height": circle_size,
+        "color": accent,
         "opacity": 0.2
     })
     
@@ -623,8 +698,8 @@ def create_story_layout(width: int, height: int, palette: Dict, fonts: Dict, con
         "y": height * 0.52,
         "width": width * 0.9,
         "fontSize": int(width * 0.12),
-        "color": palette["text"],
-        "fontFamily": fonts["heading"],
+        "color": text_color,
+        "fontFamily": heading_font,
         "fontWeight": "bold",
         "textAlign": "center"
     })
@@ -637,8 +712,8 @@ def create_story_layout(width: int, height: int, palette: Dict, fonts: Dict, con
         "y": height * 0.65,
         "width": width * 0.8,
         "fontSize": int(width * 0.045),
-        "color": palette["muted"],
-        "fontFamily": fonts["body"],
+        "color": muted,
+        "fontFamily": body_font,
         "textAlign": "center"
     })
     
@@ -650,7 +725,7 @@ def create_story_layout(width: int, height: int, palette: Dict, fonts: Dict, con
         "y": height * 0.85,
         "width": width,
         "fontSize": int(width * 0.1),
-        "color": palette["primary"],
+        "color": primary,
         "fontFamily": "Arial",
         "textAlign": "center"
     })
@@ -662,8 +737,8 @@ def create_story_layout(width: int, height: int, palette: Dict, fonts: Dict, con
         "y": height * 0.92,
         "width": width,
         "fontSize": int(width * 0.035),
-        "color": palette["muted"],
-        "fontFamily": fonts["body"],
+        "color": muted,
+        "fontFamily": body_font,
         "fontWeight": "600",
         "textAlign": "center",
         "letterSpacing": 2
@@ -672,18 +747,31 @@ def create_story_layout(width: int, height: int, palette: Dict, fonts: Dict, con
     return elements
 
 
-def create_event_layout(width: int, height: int, palette: Dict, fonts: Dict, content: Dict) -> List[Dict]:
+def create_event_layout(width: int, height: int, palette: Palette, fonts: FontCombo, content: Dict) -> List[Dict]:
     """Event/Announcement layout"""
+    primary = palette.primary
+    secondary = palette.secondary
+    accent = palette.accent
+    text_color = palette.text
+    muted = palette.muted
+    heading_font = fonts.heading
+    body_font = fonts.body
+    corner_offset = -width * 0.1
+    top_circle = width * 0.4
+    bottom_circle = width * 0.35
+    tag_x = width * 0.35
+    tag_width = width * 0.3
+    
     elements = []
     
     # Decorative shapes
     elements.append({
         "type": "circle",
-        "x": -width * 0.1,
-        "y": -width * 0.1,
-        "width": width * 0.4,
-        "height": width * 0.4,
-        "color": palette["accent"],
+        "x": corner_offset,
+        "y": corner_offset,
+        "width": top_circle,
+        "height": top_circle,
+        "color": accent,
         "opacity": 0.3
     })
     
@@ -691,32 +779,32 @@ def create_event_layout(width: int, height: int, palette: Dict, fonts: Dict, con
         "type": "circle",
         "x": width * 0.75,
         "y": height * 0.7,
-        "width": width * 0.35,
-        "height": width * 0.35,
-        "color": palette["secondary"],
+        "width": bottom_circle,
+        "height": bottom_circle,
+        "color": secondary,
         "opacity": 0.3
     })
     
     # Event type tag
     elements.append({
         "type": "rect",
-        "x": width * 0.35,
+        "x": tag_x,
         "y": height * 0.12,
-        "width": width * 0.3,
+        "width": tag_width,
         "height": height * 0.045,
-        "color": palette["accent"],
+        "color": accent,
         "borderRadius": 20
     })
     
     elements.append({
         "type": "textbox",
         "text": content.get("tag", "WEBINAR"),
-        "x": width * 0.35,
+        "x": tag_x,
         "y": height * 0.128,
-        "width": width * 0.3,
+        "width": tag_width,
         "fontSize": int(width * 0.022),
         "color": "#ffffff",
-        "fontFamily": fonts["body"],
+        "fontFamily": body_font,
         "fontWeight": "bold",
         "textAlign": "center",
         "letterSpacing": 2
@@ -730,8 +818,8 @@ def create_event_layout(width: int, height: int, palette: Dict, fonts: Dict, con
         "y": height * 0.22,
         "width": width * 0.84,
         "fontSize": int(width * 0.065),
-        "color": palette["text"],
-        "fontFamily": fonts["heading"],
+        "color": text_color,
+        "fontFamily": heading_font,
         "fontWeight": "bold",
         "textAlign": "center",
         "lineHeight": 1.1
@@ -745,8 +833,8 @@ def create_event_layout(width: int, height: int, palette: Dict, fonts: Dict, con
         "y": height * 0.45,
         "width": width,
         "fontSize": int(width * 0.04),
-        "color": palette["primary"],
-        "fontFamily": fonts["body"],
+        "color": primary,
+        "fontFamily": body_font,
         "fontWeight": "bold",
         "textAlign": "center"
     })
@@ -758,8 +846,8 @@ def create_event_layout(width: int, height: int, palette: Dict, fonts: Dict, con
         "y": height * 0.52,
         "width": width,
         "fontSize": int(width * 0.032),
-        "color": palette["muted"],
-        "fontFamily": fonts["body"],
+        "color": muted,
+        "fontFamily": body_font,
         "textAlign": "center"
     })
     
@@ -771,8 +859,8 @@ def create_event_layout(width: int, height: int, palette: Dict, fonts: Dict, con
         "y": height * 0.6,
         "width": width * 0.76,
         "fontSize": int(width * 0.026),
-        "color": palette["muted"],
-        "fontFamily": fonts["body"],
+        "color": muted,
+        "fontFamily": body_font,
         "textAlign": "center",
         "lineHeight": 1.5
     })
@@ -781,14 +869,15 @@ def create_event_layout(width: int, height: int, palette: Dict, fonts: Dict, con
     btn_width = width * 0.45
     btn_height = height * 0.07
     btn_x = (width - btn_width) / 2
+    btn_y = height * 0.76
     
     elements.append({
         "type": "rect",
         "x": btn_x,
-        "y": height * 0.76,
+        "y": btn_y,
         "width": btn_width,
         "height": btn_height,
-        "color": palette["primary"],
+        "color": primary,
         "borderRadius": 8
     })
     
@@ -796,11 +885,11 @@ def create_event_layout(width: int, height: int, palette: Dict, fonts: Dict, con
         "type": "textbox",
         "text": content.get("cta", "REGISTER FREE"),
         "x": btn_x,
-        "y": height * 0.76 + btn_height * 0.25,
+        "y": btn_y + btn_height * 0.25,
         "width": btn_width,
         "fontSize": int(width * 0.028),
         "color": "#ffffff",
-        "fontFamily": fonts["body"],
+        "fontFamily": body_font,
         "fontWeight": "bold",
         "textAlign": "center"
     })
@@ -813,8 +902,8 @@ def create_event_layout(width: int, height: int, palette: Dict, fonts: Dict, con
         "y": height * 0.9,
         "width": width,
         "fontSize": int(width * 0.025),
-        "color": palette["muted"],
-        "fontFamily": fonts["heading"],
+        "color": muted,
+        "fontFamily": heading_font,
         "textAlign": "center",
         "letterSpacing": 3
     })
@@ -822,8 +911,16 @@ def create_event_layout(width: int, height: int, palette: Dict, fonts: Dict, con
     return elements
 
 
-def create_product_layout(width: int, height: int, palette: Dict, fonts: Dict, content: Dict) -> List[Dict]:
+def create_product_layout(width: int, height: int, palette: Palette, fonts: FontCombo, content: Dict) -> List[Dict]:
     """Product showcase layout"""
+    primary = palette.primary
+    secondary = palette.secondary
+    text_color = palette.text
+    muted = palette.muted
+    heading_font = fonts.heading
+    body_font = fonts.body
+    circle_size = width * 0.6
+    
     elements = []
     
     # Product image placeholder (circle)
@@ -831,9 +928,9 @@ def create_product_layout(width: int, height: int, palette: Dict, fonts: Dict, c
         "type": "circle",
         "x": width * 0.2,
         "y": height * 0.08,
-        "width": width * 0.6,
-        "height": width * 0.6,
-        "color": palette["secondary"],
+        "width": circle_size,
+        "height": circle_size,
+        "color": secondary,
         "opacity": 0.15
     })
     
@@ -845,8 +942,8 @@ def create_product_layout(width: int, height: int, palette: Dict, fonts: Dict, c
         "y": height * 0.52,
         "width": width * 0.9,
         "fontSize": int(width * 0.07),
-        "color": palette["text"],
-        "fontFamily": fonts["heading"],
+        "color": text_color,
+        "fontFamily": heading_font,
         "fontWeight": "bold",
         "textAlign": "center"
     })
@@ -859,8 +956,8 @@ def create_product_layout(width: int, height: int, palette: Dict, fonts: Dict, c
         "y": height * 0.62,
         "width": width * 0.8,
         "fontSize": int(width * 0.03),
-        "color": palette["muted"],
-        "fontFamily": fonts["body"],
+        "color": muted,
+        "fontFamily": body_font,
         "textAlign": "center",
         "lineHeight": 1.4
     })
@@ -873,8 +970,8 @@ def create_product_layout(width: int, height: int, palette: Dict, fonts: Dict, c
         "y": height * 0.72,
         "width": width,
         "fontSize": int(width * 0.08),
-        "color": palette["primary"],
-        "fontFamily": fonts["heading"],
+        "color": primary,
+        "fontFamily": heading_font,
         "fontWeight": "bold",
         "textAlign": "center"
     })
@@ -883,14 +980,15 @@ def create_product_layout(width: int, height: int, palette: Dict, fonts: Dict, c
     btn_width = width * 0.5
     btn_height = height * 0.07
     btn_x = (width - btn_width) / 2
+    btn_y = height * 0.82
     
     elements.append({
         "type": "rect",
         "x": btn_x,
-        "y": height * 0.82,
+        "y": btn_y,
         "width": btn_width,
         "height": btn_height,
-        "color": palette["primary"],
+        "color": primary,
         "borderRadius": 8
     })
     
@@ -898,11 +996,11 @@ def create_product_layout(width: int, height: int, palette: Dict, fonts: Dict, c
         "type": "textbox",
         "text": content.get("cta", "BUY NOW"),
         "x": btn_x,
-        "y": height * 0.82 + btn_height * 0.25,
+        "y": btn_y + btn_height * 0.25,
         "width": btn_width,
         "fontSize": int(width * 0.03),
         "color": "#ffffff",
-        "fontFamily": fonts["body"],
+        "fontFamily": body_font,
         "fontWeight": "bold",
         "textAlign": "center"
     })
@@ -915,8 +1013,8 @@ def create_product_layout(width: int, height: int, palette: Dict, fonts: Dict, c
         "y": height * 0.93,
         "width": width,
         "fontSize": int(width * 0.022),
-        "color": palette["muted"],
-        "fontFamily": fonts["heading"],
+        "color": muted,
+        "fontFamily": heading_font,
         "textAlign": "center",
         "letterSpacing": 3
     })
@@ -924,8 +1022,14 @@ def create_product_layout(width: int, height: int, palette: Dict, fonts: Dict, c
     return elements
 
 
-def create_quote_layout(width: int, height: int, palette: Dict, fonts: Dict, content: Dict) -> List[Dict]:
+def create_quote_layout(width: int, height: int, palette: Palette, fonts: FontCombo, content: Dict) -> List[Dict]:
     """Inspirational quote layout"""
+    accent = palette.accent
+    text_color = palette.text
+    muted = palette.muted
+    heading_font = fonts.heading
+    body_font = fonts.body
+    
     elements = []
     
     # Large quotation mark
@@ -936,7 +1040,7 @@ def create_quote_layout(width: int, height: int, palette: Dict, fonts: Dict, con
         "y": height * 0.15,
         "width": width * 0.3,
         "fontSize": int(width * 0.3),
-        "color": palette["accent"],
+        "color": accent,
         "fontFamily": "Georgia",
         "opacity": 0.3
     })
@@ -949,8 +1053,8 @@ def create_quote_layout(width: int, height: int, palette: Dict, fonts: Dict, con
         "y": height * 0.32,
         "width": width * 0.8,
         "fontSize": int(width * 0.055),
-        "color": palette["text"],
-        "fontFamily": fonts["heading"],
+        "color": text_color,
+        "fontFamily": heading_font,
         "fontWeight": "normal",
         "textAlign": "center",
         "lineHeight": 1.4,
@@ -964,7 +1068,7 @@ def create_quote_layout(width: int, height: int, palette: Dict, fonts: Dict, con
         "y": height * 0.68,
         "width": width * 0.2,
         "height": 3,
-        "color": palette["accent"]
+        "color": accent
     })
     
     # Author
@@ -975,8 +1079,8 @@ def create_quote_layout(width: int, height: int, palette: Dict, fonts: Dict, con
         "y": height * 0.73,
         "width": width,
         "fontSize": int(width * 0.032),
-        "color": palette["muted"],
-        "fontFamily": fonts["body"],
+        "color": muted,
+        "fontFamily": body_font,
         "textAlign": "center"
     })
     
@@ -988,8 +1092,8 @@ def create_quote_layout(width: int, height: int, palette: Dict, fonts: Dict, con
         "y": height * 0.88,
         "width": width,
         "fontSize": int(width * 0.022),
-        "color": palette["muted"],
-        "fontFamily": fonts["heading"],
+        "color": muted,
+        "fontFamily": heading_font,
         "textAlign": "center",
         "letterSpacing": 3
     })
@@ -1010,55 +1114,71 @@ LAYOUTS = {
 }
 
 
+# Prompt extraction patterns, compiled once at import
+_DISCOUNT_RE = re.compile(r'(\d+)\s*%\s*(off|discount)?')
+_PRICE_RE = re.compile(r'\$\s*(\d+(?:\.\d{2})?)')
+# Every date form contains a digit; the numeric forms also need their separator
+_DIGIT_RE = re.compile(r'\d')
+_DATE_RES = (
+    ('', re.compile(r'(january|february|march|april|may|june|july|august|september|october|november|december)\s+\d{1,2}(?:st|nd|rd|th)?(?:,?\s*\d{4})?')),
+    ('/', re.compile(r'\d{1,2}/\d{1,2}/\d{2,4}')),
+    ('-', re.compile(r'\d{1,2}-\d{1,2}-\d{2,4}')),
+)
+_TIME_RE = re.compile(r'\d{1,2}(?::\d{2})?\s*(?:am|pm|AM|PM)')
+_BRAND_STOP_WORDS = frozenset({"FOR", "THE", "AND", "WITH"})
+_SKIP_WORDS = frozenset({'ad', 'poster', 'banner', 'flyer', 'image', 'graphic', 'format', 'square', 'landscape', 'portrait', 'story', 'meta', 'instagram', 'facebook', 'google', 'linkedin'})
+_INSTRUCTION_WORDS_RE = re.compile(r'\b(create|design|make|generate|an?|the|for|with|using|that|has|is)\b', re.IGNORECASE)
+
+
 def extract_content_from_prompt(prompt: str) -> Dict[str, str]:
     """Extract meaningful content from user prompt using NLP patterns"""
     content = {}
     prompt_lower = prompt.lower()
     
-    # Extract discount percentages
-    discount_match = re.search(r'(\d+)\s*%\s*(off|discount)?', prompt_lower)
-    if discount_match:
-        content["discount"] = f"{discount_match.group(1)}%"
+    # Extract discount percentages. The pattern starts with \d, which the
+    # regex engine cannot skip ahead to, so rule out '%'-free prompts first.
+    if '%' in prompt_lower:
+        discount_match = _DISCOUNT_RE.search(prompt_lower)
+        if discount_match:
+            content["discount"] = f"{discount_match.group(1)}%"
     
     # Extract prices
-    price_match = re.search(r'\$\s*(\d+(?:\.\d{2})?)', prompt)
-    if price_match:
-        content["price"] = f"${price_match.group(1)}"
+    if '$' in prompt:
+        price_match = _PRICE_RE.search(prompt)
+        if price_match:
+            content["price"] = f"${price_match.group(1)}"
     
     # Extract dates
-    date_patterns = [
-        r'(january|february|march|april|may|june|july|august|september|october|november|december)\s+\d{1,2}(?:st|nd|rd|th)?(?:,?\s*\d{4})?',
-        r'\d{1,2}/\d{1,2}/\d{2,4}',
-        r'\d{1,2}-\d{1,2}-\d{2,4}'
-    ]
-    for pattern in date_patterns:
-        date_match = re.search(pattern, prompt_lower)
-        if date_match:
-            content["date"] = date_match.group(0).title()
-            break
+    if _DIGIT_RE.search(prompt_lower):
+        for separator, pattern in _DATE_RES:
+            if separator not in prompt_lower:
+                continue
+            date_match = pattern.search(prompt_lower)
+            if date_match:
+                content["date"] = date_match.group(0).title()
+                break
     
     # Extract time
-    time_match = re.search(r'\d{1,2}(?::\d{2})?\s*(?:am|pm|AM|PM)', prompt)
+    time_match = _TIME_RE.search(prompt)
     if time_match:
         content["time"] = time_match.group(0).upper()
     
     # Extract brand names (capitalized words that might be brands)
-    words = prompt.split()
-    for i, word in enumerate(words):
-        if word.isupper() and len(word) > 2 and word not in ["FOR", "THE", "AND", "WITH"]:
+    for word in prompt.split():
+        if word.isupper() and len(word) > 2 and word not in _BRAND_STOP_WORDS:
             content["brand"] = word
             break
     
     # Generate headline from prompt
     # Remove common instruction words
-    cleaned = re.sub(r'\b(create|design|make|generate|an?|the|for|with|using|that|has|is)\b', '', prompt_lower, flags=re.IGNORECASE)
-    cleaned = re.sub(r'\s+', ' ', cleaned).strip()
+    # Only the whitespace-split words are used below, so the removal leaves
+    # gaps in place instead of collapsing them in a second pass.
+    cleaned = _INSTRUCTION_WORDS_RE.sub('', prompt_lower)
     
     # Take meaningful words for headline
     headline_words = []
-    skip_words = {'ad', 'poster', 'banner', 'flyer', 'image', 'graphic', 'format', 'square', 'landscape', 'portrait', 'story', 'meta', 'instagram', 'facebook', 'google', 'linkedin'}
-    for word in cleaned.split()[:6]:
-        if word.lower() not in skip_words and len(word) > 2:
+    for word in cleaned.split(None, 6)[:6]:
+        if word.lower() not in _SKIP_WORDS and len(word) > 2:
             headline_words.append(word.capitalize())
     
     if headline_words:
@@ -1067,30 +1187,54 @@ def extract_content_from_prompt(prompt: str) -> Dict[str, str]:
     return content
 
 
+# Palette keywords in priority order; the first palette with a matching keyword wins
+_PALETTE_KEYWORDS = (
+    ("tech_dark", ("tech", "startup", "ai", "software", "app", "digital", "cyber", "innovation", "code", "developer")),
+    ("tech_light", ("saas", "cloud", "platform", "b2b")),
+    ("fashion_vibrant", ("fashion", "style", "clothing", "trendy", "summer", "spring", "colorful")),
+    ("fashion_minimal", ("elegant", "luxury fashion", "boutique", "minimal fashion", "fall", "autumn", "winter")),
+    ("sale_urgent", ("sale", "discount", "offer", "deal", "limited", "hurry", "flash", "clearance")),
+    ("sale_black_friday", ("black friday", "cyber monday", "mega sale", "biggest")),
+    ("business_corporate", ("business", "corporate", "professional", "enterprise", "consulting", "finance")),
+    ("business_modern", ("agency", "services", "solution", "team")),
+    ("food_warm", ("food", "restaurant", "pizza", "burger", "fast food", "delivery", "hungry")),
+    ("food_fresh", ("healthy", "organic", "vegan", "salad", "fresh", "green", "smoothie")),
+    ("wellness_calm", ("wellness", "yoga", "meditation", "spa", "relax", "health", "fitness", "calm")),
+    ("luxury_gold", ("luxury", "premium", "exclusive", "vip", "gold", "diamond", "high-end")),
+    ("creative_gradient", ("creative", "design", "art", "portfolio", "music", "festival", "party")),
+    ("event_party", ("event", "party", "celebration", "concert", "dj", "night")),
+    ("education_bright", ("education", "course", "learn", "school", "university", "webinar", "workshop")),
+    ("minimalist_clean", ("minimal", "clean", "simple", "modern", "basic")),
+)
+
+# Layout and font keywords are matched as substrings, so stems like "motivat" still work
+_LAYOUT_KEYWORDS = (
+    ("sale", ("sale", "discount", "off", "deal", "offer", "clearance")),
+    ("event", ("event", "webinar", "conference", "workshop", "seminar", "meetup")),
+    ("product", ("product", "buy", "shop", "new arrival", "launch", "price")),
+    ("quote", ("quote", "inspiration", "motivat", "wisdom", "said")),
+    ("minimal", ("minimal", "clean", "simple", "elegant")),
+)
+_FALLBACK_LAYOUTS = ("hero", "split", "minimal")
+
+_FONT_KEYWORDS = (
+    ("tech", ("tech", "startup", "modern", "digital")),
+    ("elegant", ("fashion", "elegant", "luxury", "beauty")),
+    ("bold", ("sale", "discount", "bold", "urgent")),
+    ("fun", ("fun", "party", "creative", "festival")),
+    ("minimal", ("minimal", "clean", "simple")),
+    ("classic", ("business", "corporate", "professional")),
+)
+
+
 def select_palette_for_prompt(prompt: str) -> str:
     """Select appropriate color palette based on prompt keywords"""
-    prompt_lower = prompt.lower()
-    
-    keyword_mapping = {
-        "tech_dark": ["tech", "startup", "ai", "software", "app", "digital", "cyber", "innovation", "code", "developer"],
-        "tech_light": ["saas", "cloud", "platform", "b2b"],
-        "fashion_vibrant": ["fashion", "style", "clothing", "trendy", "summer", "spring", "colorful"],
-        "fashion_minimal": ["elegant", "luxury fashion", "boutique", "minimal fashion", "fall", "autumn", "winter"],
-        "sale_urgent": ["sale", "discount", "offer", "deal", "limited", "hurry", "flash", "clearance"],
-        "sale_black_friday": ["black friday", "cyber monday", "mega sale", "biggest"],
-        "business_corporate": ["business", "corporate", "professional", "enterprise", "consulting", "finance"],
-        "business_modern": ["agency", "services", "solution", "team"],
-        "food_warm": ["food", "restaurant", "pizza", "burger", "fast food", "delivery", "hungry"],
-        "food_fresh": ["healthy", "organic", "vegan", "salad", "fresh", "green", "smoothie"],
-        "wellness_calm": ["wellness", "yoga", "meditation", "spa", "relax", "health", "fitness", "calm"],
-        "luxury_gold": ["luxury", "premium", "exclusive", "vip", "gold", "diamond", "high-end"],
-        "creative_gradient": ["creative", "design", "art", "portfolio", "music", "festival", "party"],
-        "event_party": ["event", "party", "celebration", "concert", "dj", "night"],
-        "education_bright": ["education", "course", "learn", "school", "university", "webinar", "workshop"],
-        "minimalist_clean": ["minimal", "clean", "simple", "modern", "basic"]
-    }
-    
-    for palette_name, keywords in keyword_mapping.items():
+    return _select_palette_lower(prompt.lower())
+
+
+def _select_palette_lower(prompt_lower: str) -> str:
+    """select_palette_for_prompt for an already lowercased prompt"""
+    for palette_name, keywords in _PALETTE_KEYWORDS:
         for keyword in keywords:
             if keyword in prompt_lower:
                 return palette_name
@@ -1100,239 +1244,258 @@ def select_palette_for_prompt(prompt: str) -> str:
 
 def select_layout_for_prompt(prompt: str, format: str) -> str:
     """Select appropriate layout based on prompt and format"""
-    prompt_lower = prompt.lower()
-    
+    return _select_layout_lower(prompt.lower(), format)
+
+
+def _select_layout_lower(prompt_lower: str, format: str) -> str:
+    """select_layout_for_prompt for an already lowercased prompt"""
     # Story format always uses story layout
     if format in ["story", "portrait"]:
         return "story"
     
     # Keyword-based selection
-    if any(word in prompt_lower for word in ["sale", "discount", "off", "deal", "offer", "clearance"]):
-        return "sale"
-    
-    if any(word in prompt_lower for word in ["event", "webinar", "conference", "workshop", "seminar", "meetup"]):
-        return "event"
-    
-    if any(word in prompt_lower for word in ["product", "buy", "shop", "new arrival", "launch", "price"]):
-        return "product"
-    
-    if any(word in prompt_lower for word in ["quote", "inspiration", "motivat", "wisdom", "said"]):
-        return "quote"
-    
-    if any(word in prompt_lower for word in ["minimal", "clean", "simple", "elegant"]):
-        return "minimal"
+    for layout_name, keywords in _LAYOUT_KEYWORDS:
+        for keyword in keywords:
+            if keyword in prompt_lower:
+                return layout_name
     
     # Default layouts by format
     if format == "landscape":
         return "split"
     
-    return random.choice(["hero", "split", "minimal"])
+    # Stable per-prompt pick so the same prompt always gets the same layout
+    return _FALLBACK_LAYOUTS[zlib.crc32(prompt_lower.encode()) % len(_FALLBACK_LAYOUTS)]
 
 
 def select_fonts_for_prompt(prompt: str) -> str:
     """Select font combination based on prompt"""
-    prompt_lower = prompt.lower()
-    
-    if any(word in prompt_lower for word in ["tech", "startup", "modern", "digital"]):
-        return "tech"
-    if any(word in prompt_lower for word in ["fashion", "elegant", "luxury", "beauty"]):
-        return "elegant"
-    if any(word in prompt_lower for word in ["sale", "discount", "bold", "urgent"]):
-        return "bold"
-    if any(word in prompt_lower for word in ["fun", "party", "creative", "festival"]):
-        return "fun"
-    if any(word in prompt_lower for word in ["minimal", "clean", "simple"]):
-        return "minimal"
-    if any(word in prompt_lower for word in ["business", "corporate", "professional"]):
-        return "classic"
+    return _select_fonts_lower(prompt.lower())
+
+
+def _select_fonts_lower(prompt_lower: str) -> str:
+    """select_fonts_for_prompt for an already lowercased prompt"""
+    for fonts_name, keywords in _FONT_KEYWORDS:
+        for keyword in keywords:
+            if keyword in prompt_lower:
+                return fonts_name
     
     return "modern"
 
 
+def _split_background(background: str) -> Tuple[str, Optional[str]]:
+    """Split a palette background into (background_color, background_gradient)"""
+    if not background.startswith("linear"):
+        return background, None
+    return background.split()[0].replace("linear-gradient(135deg,", "").replace("linear-gradient(180deg,", "").strip(), background
+
+
+_PALETTE_BACKGROUNDS = {name: _split_background(palette.background) for name, palette in COLOR_PALETTES.items()}
+
+
+# Content used wherever the prompt does not provide a value
+_CONTENT_DEFAULTS = {
+    "headline": "Your Message Here",
+    "subheadline": "Add your supporting text",
+    "cta": "Learn More",
+    "brand": "BRAND",
+    "tag": "FEATURED",
+    "banner": "LIMITED TIME",
+    "description": "Transform your ideas into stunning visuals",
+    "discount": "50%",
+    "price": "$99",
+    "date": "Coming Soon",
+    "time": "",
+    "author": "— Unknown"
+}
+
+
+@lru_cache(maxsize=1024)
+def _analyze_prompt(prompt: str) -> Tuple[str, str, str, Tuple[Tuple[str, str], ...]]:
+    """Deterministic prompt analysis: lowercased prompt, palette, fonts and extracted content"""
+    prompt_lower = prompt.lower()
+    # Extracted values override the defaults
+    content = {**_CONTENT_DEFAULTS, **extract_content_from_prompt(prompt)}
+    return prompt_lower, _select_palette_lower(prompt_lower), _select_fonts_lower(prompt_lower), tuple(content.items())
+
+
 def generate_professional_design(prompt: str, platform: str, format: str, specs: dict) -> dict:
     """Generate a professional Canva-like design based on prompt"""
-    
-    width = specs.get("width", 1080)
-    height = specs.get("height", 1080)
+    return generate_professional_design_variants(prompt, platform, format, [specs])[0]
+
+
+def generate_professional_design_variants(prompt: str, platform: str, format: str,
+                                          specs_list: List[dict]) -> List[dict]:
+    """Generate one design at several sizes, analyzing the prompt only once"""
     
     # Select design parameters
-    palette_name = select_palette_for_prompt(prompt)
+    prompt_lower, palette_name, fonts_name, content_items = _analyze_prompt(prompt)
     palette = COLOR_PALETTES[palette_name]
-    
-    fonts_name = select_fonts_for_prompt(prompt)
     fonts = FONT_COMBOS[fonts_name]
     
-    layout_name = select_layout_for_prompt(prompt, format)
+    # Layout also depends on format, so it is not cached with the rest
+    layout_name = _select_layout_lower(prompt_lower, format)
     layout_func = LAYOUTS[layout_name]
     
-    # Extract content from prompt
-    content = extract_content_from_prompt(prompt)
-    
-    # Set defaults if not extracted
-    defaults = {
-        "headline": "Your Message Here",
-        "subheadline": "Add your supporting text",
-        "cta": "Learn More",
-        "brand": "BRAND",
-        "tag": "FEATURED",
-        "banner": "LIMITED TIME",
-        "description": "Transform your ideas into stunning visuals",
-        "discount": "50%",
-        "price": "$99",
-        "date": "Coming Soon",
-        "time": "",
-        "author": "— Unknown"
-    }
-    
-    for key, value in defaults.items():
-        if key not in content:
-            content[key] = value
-    
-    # Generate elements using selected layout
-    elements = layout_func(width, height, palette, fonts, content)
+    content = dict(content_items)
     
     # Determine background
-    background = palette["background"]
-    
-    return {
-        "background_color": background if not background.startswith("linear") else background.split()[0].replace("linear-gradient(135deg,", "").replace("linear-gradient(180deg,", "").strip(),
-        "background_gradient": background if background.startswith("linear") else None,
-        "elements": elements,
-        "layout": {
-            "type": layout_name,
-            "palette": palette_name,
-            "fonts": fonts_name,
-            "prompt": prompt,
-            "width": width,
-            "height": height
-        },
-        "metadata": {
-            "template_version": "2.0",
-            "generator": "AdGenesis Pro",
-            "editable": True
-        }
-    }
+    background_color, background_gradient = _PALETTE_BACKGROUNDS[palette_name]
+    
+    designs = []
+    for specs in specs_list:
+        width = specs.get("width", 1080)
+        height = specs.get("height", 1080)
+        
+        # Generate elements using selected layout
+        elements = layout_func(width, height, palette, fonts, content)
+        
+        designs.append({
+            "background_color": background_color,
+            "background_gradient": background_gradient,
+            "elements": elements,
+            "layout": {
+                "type": layout_name,
+                "palette": palette_name,
+                "fonts": fonts_name,
+                "prompt": prompt,
+                "width": width,
+                "height": height
+            },
+            "metadata": {
+                "template_version": "2.0",
+                "generator": "AdGenesis Pro",
+                "editable": True
+            }
+        })
+    
+    return designs
+
+
+def generate_professional_design_batch(prompts: List[str], platform: str, format: str,
+                                       specs: dict) -> List[dict]:
+    """Generate one design per prompt; repeated prompts reuse the cached analysis"""
+    specs_list = [specs]
+    return [generate_professional_design_variants(prompt, platform, format, specs_list)[0] for prompt in prompts]
 
 
 # Template Gallery Data
-TEMPLATE_GALLERY = [
-    {
-        "id": "tech-startup-hero",
-        "name": "Tech Startup Hero",
-        "category": "Technology",
-        "preview_prompt": "Create a tech startup ad",
-        "palette": "tech_dark",
-        "layout": "hero",
-        "fonts": "tech"
-    },
-    {
-        "id": "fashion-sale",
-        "name": "Fashion Sale",
-        "category": "Fashion",
-        "preview_prompt": "Create a fashion sale ad with 50% off",
-        "palette": "fashion_vibrant",
-        "layout": "sale",
-        "fonts": "fun"
-    },
-    {
-        "id": "business-corporate",
-        "name": "Business Corporate",
-        "category": "Business",
-        "preview_prompt": "Create a business consulting ad",
-        "palette": "business_corporate",
-        "layout": "split",
-        "fonts": "classic"
-    },
-    {
-        "id": "food-delivery",
-        "name": "Food Delivery",
-        "category": "Food",
-        "preview_prompt": "Create a food delivery ad",
-        "palette": "food_warm",
-        "layout": "product",
-        "fonts": "bold"
-    },
-    {
-        "id": "event-webinar",
-        "name": "Event Webinar",
-        "category": "Events",
-        "preview_prompt": "Create a webinar event ad",
-        "palette": "education_bright",
-        "layout": "event",
-        "fonts": "modern"
-    },
-    {
-        "id": "minimal-elegant",
-        "name": "Minimal Elegant",
-        "category": "Minimal",
-        "preview_prompt": "Create a minimal elegant ad",
-        "palette": "minimalist_clean",
-        "layout": "minimal",
-        "fonts": "minimal"
-    },
-    {
-        "id": "luxury-premium",
-        "name": "Luxury Premium",
-        "category": "Luxury",
-        "preview_prompt": "Create a luxury premium ad",
-        "palette": "luxury_gold",
-        "layout": "hero",
-        "fonts": "luxury"
-    },
-    {
-        "id": "creative-gradient",
-        "name": "Creative Gradient",
-        "category": "Creative",
-        "preview_prompt": "Create a creative portfolio ad",
-        "palette": "creative_gradient",
-        "layout": "hero",
-        "fonts": "fun"
-    },
-    {
-        "id": "wellness-calm",
-        "name": "Wellness Calm",
-        "category": "Wellness",
-        "preview_prompt": "Create a wellness spa ad",
-        "palette": "wellness_calm",
-        "layout": "minimal",
-        "fonts": "elegant"
-    },
-    {
-        "id": "black-friday",
-        "name": "Black Friday Sale",
-        "category": "Sales",
-        "preview_prompt": "Create a black friday sale ad",
-        "palette": "sale_black_friday",
-        "layout": "sale",
-        "fonts": "bold"
-    },
-    {
-        "id": "inspirational-quote",
-        "name": "Inspirational Quote",
-        "category": "Quotes",
-        "preview_prompt": "Create an inspirational quote poster",
-        "palette": "minimalist_clean",
-        "layout": "quote",
-        "fonts": "elegant"
-    },
-    {
-        "id": "story-swipe",
-        "name": "Story Swipe Up",
-        "category": "Social",
-        "preview_prompt": "Create an Instagram story ad",
-        "palette": "creative_gradient",
-        "layout": "story",
-        "fonts": "fun"
-    }
-]
+TEMPLATE_GALLERY = (
+    Template(
+        id="tech-startup-hero",
+        name="Tech Startup Hero",
+        category="Technology",
+        preview_prompt="Create a tech startup ad",
+        palette="tech_dark",
+        layout="hero",
+        fonts="tech"
+    ),
+    Template(
+        id="fashion-sale",
+        name="Fashion Sale",
+        category="Fashion",
+        preview_prompt="Create a fashion sale ad with 50% off",
+        palette="fashion_vibrant",
+        layout="sale",
+        fonts="fun"
+    ),
+    Template(
+        id="business-corporate",
+        name="Business Corporate",
+        category="Business",
+        preview_prompt="Create a business consulting ad",
+        palette="business_corporate",
+        layout="split",
+        fonts="classic"
+    ),
+    Template(
+        id="food-delivery",
+        name="Food Delivery",
+        category="Food",
+        preview_prompt="Create a food delivery ad",
+        palette="food_warm",
+        layout="product",
+        fonts="bold"
+    ),
+    Template(
+        id="event-webinar",
+        name="Event Webinar",
+        category="Events",
+        preview_prompt="Create a webinar event ad",
+        palette="education_bright",
+        layout="event",
+        fonts="modern"
+    ),
+    Template(
+        id="minimal-elegant",
+        name="Minimal Elegant",
+        category="Minimal",
+        preview_prompt="Create a minimal elegant ad",
+        palette="minimalist_clean",
+        layout="minimal",
+        fonts="minimal"
+    ),
+    Template(
+        id="luxury-premium",
+        name="Luxury Premium",
+        category="Luxury",
+        preview_prompt="Create a luxury premium ad",
+        palette="luxury_gold",
+        layout="hero",
+        fonts="luxury"
+    ),
+    Template(
+        id="creative-gradient",
+        name="Creative Gradient",
+        category="Creative",
+        preview_prompt="Create a creative portfolio ad",
+        palette="creative_gradient",
+        layout="hero",
+        fonts="fun"
+    ),
+    Template(
+        id="wellness-calm",
+        name="Wellness Calm",
+        category="Wellness",
+        preview_prompt="Create a wellness spa ad",
+        palette="wellness_calm",
+        layout="minimal",
+        fonts="elegant"
+    ),
+    Template(
+        id="black-friday",
+        name="Black Friday Sale",
+        category="Sales",
+        preview_prompt="Create a black friday sale ad",
+        palette="sale_black_friday",
+        layout="sale",
+        fonts="bold"
+    ),
+    Template(
+        id="inspirational-quote",
+        name="Inspirational Quote",
+        category="Quotes",
+        preview_prompt="Create an inspirational quote poster",
+        palette="minimalist_clean",
+        layout="quote",
+        fonts="elegant"
+    ),
+    Template(
+        id="story-swipe",
+        name="Story Swipe Up",
+        category="Social",
+        preview_prompt="Create an Instagram story ad",
+        palette="creative_gradient",
+        layout="story",
+        fonts="fun"
+    )
+)
+
+_TEMPLATE_INDEX = MappingProxyType({template.id: template for template in TEMPLATE_GALLERY})
 
 
-def get_template_by_id(template_id: str) -> dict:
+def get_template_by_id(template_id: str) -> Optional[Template]:
     """Get a specific template by ID"""
-    for template in TEMPLATE_GALLERY:
-        if template["id"] == template_id:
-            return template
-    return None
+    return _TEMPLATE_INDEX.get(template_id)
 
 
 def generate_from_template(template_id: str, custom_content: dict, specs: dict) -> dict:
@@ -1344,22 +1507,23 @@ def generate_from_template(template_id: str, custom_content: dict, specs: dict)
     width = specs.get("width", 1080)
     height = specs.get("height", 1080)
     
-    palette = COLOR_PALETTES[template["palette"]]
-    fonts = FONT_COMBOS[template["fonts"]]
-    layout_func = LAYOUTS[template["layout"]]
+    palette = COLOR_PALETTES[template.palette]
+    fonts = FONT_COMBOS[template.fonts]
+    layout_func = LAYOUTS[template.layout]
     
     elements = layout_func(width, height, palette, fonts, custom_content)
     
-    background = palette["background"]
+    background = palette.background
+    is_gradient = background.startswith("linear")
     
     return {
-        "background_color": background if not background.startswith("linear") else "#1a1a2e",
-        "background_gradient": background if background.startswith("linear") else None,
+        "background_color": "#1a1a2e" if is_gradient else background,
+        "background_gradient": background if is_gradient else None,
         "elements": elements,
         "layout": {
-            "type": template["layout"],
-            "palette": template["palette"],
-            "fonts": template["fonts"],
+            "type": template.layout,
+            "palette": template.palette,
+            "fonts": template.fonts,
             "template_id": template_id,
             "width": width,
             "height": height
@@ -5,10 +5,14 @@ Creates UNIQUE, agency-quality designs with HIGH VARIETY for each prompt
 
 import random
 import hashlib
-from typing import Dict, List, Any, Optional
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+from typing import Dict, List, Any, Mapping, Optional, Sequence, Tuple
 import re
 import math
 
+from frozen_tables import freeze
+
 # =============================================================================
 # DIVERSE COLOR PALETTES - Each prompt gets different colors
 # =============================================================================
@@ -136,6 +140,9 @@ ALL_PALETTES = [
     },
 ]
 
+# Palettes are shared by every design, so freeze them against in-place edits
+ALL_PALETTES = freeze(ALL_PALETTES)
+
 # =============================================================================
 # DIVERSE LAYOUT STYLES
 # =============================================================================
@@ -207,203 +214,287 @@ LAYOUT_STYLES = [
     },
 ]
 
+# Text alignment implied by each layout id
+_HEADLINE_ALIGN = {
+    layout["id"]: "center" if "center" in layout["id"] else "right" if "right" in layout["id"] else "left"
+    for layout in LAYOUT_STYLES
+}
+_BRAND_ALIGN = {layout["id"]: "left" if "left" in layout["id"] else "center" for layout in LAYOUT_STYLES}
+
 # =============================================================================
 # DIVERSE HEADLINES BY CATEGORY
 # =============================================================================
 
 HEADLINES_BY_CATEGORY = {
-    "coffee": [
+    "coffee": (
         "BREW\nPERFECTION", "COFFEE\nCULTURE", "WAKE UP\nIN STYLE",
         "ARTISAN\nBREWS", "TASTE THE\nDIFFERENCE", "DAILY\nRITUAL",
         "ROASTED\nFRESH", "CAFÉ\nVIBES", "ESPRESSO\nYOURSELF",
-    ],
-    "tech": [
+    ),
+    "tech": (
         "FUTURE\nIS HERE", "NEXT GEN\nTECH", "INNOVATE\nTODAY",
         "SMART\nSOLUTIONS", "POWER UP", "DIGITAL\nEVOLUTION",
         "CODE THE\nFUTURE", "TECH\nREDEFINED", "CONNECT\nSMARTER",
-    ],
-    "fashion": [
+    ),
+    "fashion": (
         "DEFINE\nLUXURY", "NEW\nCOLLECTION", "TIMELESS\nSTYLE",
         "ELEVATE\nYOUR LOOK", "PURE\nELEGANCE", "TREND\nSETTER",
         "WEAR YOUR\nSTORY", "STYLE\nSPEAKS", "BE BOLD",
-    ],
-    "food": [
+    ),
+    "food": (
         "TASTE\nPERFECTION", "FRESH &\nDELICIOUS", "SAVOR\nTHE MOMENT",
         "FLAVOR\nEXPLOSION", "CHEF'S\nSPECIAL", "FOOD IS\nLOVE",
         "EAT\nAMAZING", "FRESH\nDAILY", "DINE\nDIFFERENT",
-    ],
-    "fitness": [
+    ),
+    "fitness": (
         "UNLEASH\nPOWER", "STRONGER\nDAILY", "NO LIMITS",
         "TRANSFORM\nNOW", "PEAK\nPERFORMANCE", "TRAIN\nHARDER",
         "LEVEL UP", "BEAST\nMODE", "SWEAT\nSUCCEED",
-    ],
-    "beauty": [
+    ),
+    "beauty": (
         "GLOW\nDIFFERENT", "RADIANT\nBEAUTY", "PURE\nGLOW",
         "SKIN\nPERFECTION", "REVEAL\nYOU", "BEAUTY\nUNLOCKED",
         "SHINE\nBRIGHT", "NATURAL\nGLAM", "SELF LOVE",
-    ],
-    "travel": [
+    ),
+    "travel": (
         "EXPLORE\nMORE", "ADVENTURE\nAWAITS", "DISCOVER\nPARADISE",
         "DREAM\nDESTINATIONS", "ESCAPE\nNOW", "WANDER\nOFTEN",
         "GO\nFARTHER", "TRAVEL\nFREE", "NEW\nHORIZONS",
-    ],
-    "sale": [
+    ),
+    "sale": (
         "MEGA\nSALE", "BIG\nSAVINGS", "LIMITED\nTIME",
         "FLASH\nDEAL", "SAVE\nBIG", "HOT\nOFFER",
         "BEST\nPRICES", "GRAB IT\nNOW", "DON'T\nMISS OUT",
-    ],
-    "business": [
+    ),
+    "business": (
         "GROW\nYOUR BIZ", "SUCCESS\nSTARTS HERE", "SCALE\nUP",
         "BUILD\nEMPIRES", "LEAD THE\nMARKET", "BUSINESS\nELITE",
         "PROFIT\nMORE", "SMART\nMOVES", "WIN\nBIG",
-    ],
-    "default": [
+    ),
+    "default": (
         "DISCOVER\nNEW", "EXPERIENCE\nMORE", "THE BEST\nCHOICE",
         "QUALITY\nFIRST", "START\nTODAY", "MAKE IT\nHAPPEN",
         "BE\nDIFFERENT", "NEXT\nLEVEL", "CREATE\nIMPACT",
-    ],
+    ),
 }
 
 SUBHEADLINES = {
-    "coffee": ["Premium Artisan Coffee", "Freshly Roasted Daily", "Handcrafted Excellence", "Where Coffee is Art", "Your Perfect Cup Awaits"],
-    "tech": ["Revolutionary Technology", "Built for Tomorrow", "Experience Innovation", "The Smart Choice", "Powered by AI"],
-    "fashion": ["Exclusive Designer Collection", "Luxury Redefined", "Where Fashion Meets Art", "Curated for Excellence", "Make a Statement"],
-    "food": ["Fresh Ingredients Daily", "Crafted by Master Chefs", "Unforgettable Taste", "Quality You Can Taste", "Made with Love"],
-    "fitness": ["Train Like a Champion", "Results Guaranteed", "Push Your Limits", "Your Fitness Journey", "Strength Within"],
-    "beauty": ["Clinically Proven Results", "Nature Meets Science", "Luxury Skincare", "Your Natural Glow", "Feel Beautiful"],
-    "travel": ["Unforgettable Experiences", "Your Perfect Getaway", "Create Lasting Memories", "Where Dreams Come True", "Adventure Calling"],
-    "sale": ["Unbeatable Prices", "While Stocks Last", "Exclusive Offers", "Members Only", "Today Only"],
-    "business": ["Trusted by Thousands", "Industry Leaders", "Results Driven", "Your Success Partner", "Expert Solutions"],
-    "default": ["Experience Excellence", "Quality You Deserve", "Built for You", "Your Success, Our Priority", "Join the Journey"],
+    "coffee": ("Premium Artisan Coffee", "Freshly Roasted Daily", "Handcrafted Excellence", "Where Coffee is Art", "Your Perfect Cup Awaits"),
+    "tech": ("Revolutionary Technology", "Built for Tomorrow", "Experience Innovation", "The Smart Choice", "Powered by AI"),
+    "fashion": ("Exclusive Designer Collection", "Luxury Redefined", "Where Fashion Meets Art", "Curated for Excellence", "Make a Statement"),
+    "food": ("Fresh Ingredients Daily", "Crafted by Master Chefs", "Unforgettable Taste", "Quality You Can Taste", "Made with Love"),
+    "fitness": ("Train Like a Champion", "Results Guaranteed", "Push Your Limits", "Your Fitness Journey", "Strength Within"),
+    "beauty": ("Clinically Proven Results", "Nature Meets Science", "Luxury Skincare", "Your Natural Glow", "Feel Beautiful"),
+    "travel": ("Unforgettable Experiences", "Your Perfect Getaway", "Create Lasting Memories", "Where Dreams Come True", "Adventure Calling"),
+    "sale": ("Unbeatable Prices", "While Stocks Last", "Exclusive Offers", "Members Only", "Today Only"),
+    "business": ("Trusted by Thousands", "Industry Leaders", "Results Driven", "Your Success Partner", "Expert Solutions"),
+    "default": ("Experience Excellence", "Quality You Deserve", "Built for You", "Your Success, Our Priority", "Join the Journey"),
 }
 
 CTAS = {
-    "coffee": ["Order Now", "Visit Us", "Try Our Blend", "Get 20% Off", "Book a Table", "Find Us"],
-    "tech": ["Get Started", "Learn More", "Try Free", "Pre-Order", "Download Now", "Sign Up Free"],
-    "fashion": ["Shop Now", "Explore", "View Collection", "Get 30% Off", "Shop the Look", "Buy Now"],
-    "food": ["Order Now", "View Menu", "Book Table", "Get Delivery", "Try Today", "Reserve Now"],
-    "fitness": ["Join Now", "Start Free", "Get Fit", "Sign Up", "Book Class", "Try Free Week"],
-    "beauty": ["Shop Now", "Try Free", "Get Yours", "Save 25%", "Discover More", "Buy Now"],
-    "travel": ["Book Now", "Explore Deals", "Plan Trip", "Save 40%", "Start Adventure", "Get Quote"],
-    "sale": ["Shop Sale", "Grab Now", "Buy Today", "Claim Offer", "Add to Cart", "Get Deal"],
-    "business": ["Get Started", "Contact Us", "Free Quote", "Book Demo", "Learn More", "Join Now"],
-    "default": ["Get Started", "Learn More", "Shop Now", "Try Free", "Contact Us", "Sign Up"],
+    "coffee": ("Order Now", "Visit Us", "Try Our Blend", "Get 20% Off", "Book a Table", "Find Us"),
+    "tech": ("Get Started", "Learn More", "Try Free", "Pre-Order", "Download Now", "Sign Up Free"),
+    "fashion": ("Shop Now", "Explore", "View Collection", "Get 30% Off", "Shop the Look", "Buy Now"),
+    "food": ("Order Now", "View Menu", "Book Table", "Get Delivery", "Try Today", "Reserve Now"),
+    "fitness": ("Join Now", "Start Free", "Get Fit", "Sign Up", "Book Class", "Try Free Week"),
+    "beauty": ("Shop Now", "Try Free", "Get Yours", "Save 25%", "Discover More", "Buy Now"),
+    "travel": ("Book Now", "Explore Deals", "Plan Trip", "Save 40%", "Start Adventure", "Get Quote"),
+    "sale": ("Shop Sale", "Grab Now", "Buy Today", "Claim Offer", "Add to Cart", "Get Deal"),
+    "business": ("Get Started", "Contact Us", "Free Quote", "Book Demo", "Learn More", "Join Now"),
+    "default": ("Get Started", "Learn More", "Shop Now", "Try Free", "Contact Us", "Sign Up"),
 }
 
 BADGES = {
-    "coffee": ["☕ PREMIUM", "★ ARTISAN", "✦ FRESH ROAST", "● ORGANIC", "◆ LOCAL"],
-    "tech": ["⚡ NEW", "🚀 FAST", "✦ AI POWERED", "★ #1 RATED", "● SECURE"],
-    "fashion": ["✦ EXCLUSIVE", "★ LIMITED", "◆ PREMIUM", "● NEW IN", "✧ LUXURY"],
-    "food": ["🔥 HOT", "★ FRESH", "✦ SPECIAL", "● POPULAR", "◆ CHEF'S PICK"],
-    "fitness": ["💪 PRO", "⚡ POWER", "★ #1 RATED", "● RESULTS", "◆ ELITE"],
-    "beauty": ["✦ NATURAL", "★ BESTSELLER", "◆ ORGANIC", "● CRUELTY FREE", "✧ GLOW"],
-    "travel": ["✈ DEALS", "★ TOP RATED", "◆ EXCLUSIVE", "● HOT SPOT", "✦ FEATURED"],
-    "sale": ["🔥 HOT DEAL", "⚡ FLASH", "★ BEST PRICE", "● LIMITED", "◆ SAVE BIG"],
-    "business": ["★ TRUSTED", "✦ EXPERT", "◆ CERTIFIED", "● PRO", "⚡ FAST"],
-    "default": ["★ PREMIUM", "✦ TRUSTED", "◆ QUALITY", "● NEW", "⚡ HOT"],
+    "coffee": ("☕ PREMIUM", "★ ARTISAN", "✦ FRESH ROAST", "● ORGANIC", "◆ LOCAL"),
+    "tech": ("⚡ NEW", "🚀 FAST", "✦ AI POWERED", "★ #1 RATED", "● SECURE"),
+    "fashion": ("✦ EXCLUSIVE", "★ LIMITED", "◆ PREMIUM", "● NEW IN", "✧ LUXURY"),
+    "food": ("🔥 HOT", "★ FRESH", "✦ SPECIAL", "● POPULAR", "◆ CHEF'S PICK"),
+    "fitness": ("💪 PRO", "⚡ POWER", "★ #1 RATED", "● RESULTS", "◆ ELITE"),
+    "beauty": ("✦ NATURAL", "★ BESTSELLER", "◆ ORGANIC", "● CRUELTY FREE", "✧ GLOW"),
+    "travel": ("✈ DEALS", "★ TOP RATED", "◆ EXCLUSIVE", "● HOT SPOT", "✦ FEATURED"),
+    "sale": ("🔥 HOT DEAL", "⚡ FLASH", "★ BEST PRICE", "● LIMITED", "◆ SAVE BIG"),
+    "business": ("★ TRUSTED", "✦ EXPERT", "◆ CERTIFIED", "● PRO", "⚡ FAST"),
+    "default": ("★ PREMIUM", "✦ TRUSTED", "◆ QUALITY", "● NEW", "⚡ HOT"),
 }
 
 ICONS_BY_CATEGORY = {
-    "coffee": ["☕", "✦", "●", "◆"],
-    "tech": ["⚡", "◆", "▲", "●", "★"],
-    "fashion": ["◆", "✦", "★", "●", "✧"],
-    "food": ["●", "✦", "★", "◆", "🍽️"],
-    "fitness": ["▲", "◆", "●", "★", "💪"],
-    "beauty": ["✦", "◆", "●", "★", "✧"],
-    "travel": ["✦", "◆", "▲", "●", "✈"],
-    "sale": ["⚡", "★", "●", "◆", "🔥"],
-    "business": ["◆", "★", "●", "▲", "✦"],
-    "default": ["●", "◆", "✦", "★", "▲"],
+    "coffee": ("☕", "✦", "●", "◆"),
+    "tech": ("⚡", "◆", "▲", "●", "★"),
+    "fashion": ("◆", "✦", "★", "●", "✧"),
+    "food": ("●", "✦", "★", "◆", "🍽️"),
+    "fitness": ("▲", "◆", "●", "★", "💪"),
+    "beauty": ("✦", "◆", "●", "★", "✧"),
+    "travel": ("✦", "◆", "▲", "●", "✈"),
+    "sale": ("⚡", "★", "●", "◆", "🔥"),
+    "business": ("◆", "★", "●", "▲", "✦"),
+    "default": ("●", "◆", "✦", "★", "▲"),
 }
 
 INDUSTRY_EMOJIS = {
-    "coffee": ["☕", "🫘", "☕"],
-    "tech": ["💻", "🚀", "📱", "⚡"],
-    "fashion": ["👗", "👠", "✨", "💎"],
-    "food": ["🍽️", "🍕", "🍔", "🥗"],
-    "fitness": ["💪", "🏋️", "🔥", "⚡"],
-    "beauty": ["✨", "💄", "🌸", "💅"],
-    "travel": ["✈️", "🌴", "🏖️", "🗺️"],
-    "sale": ["🔥", "💥", "⚡", "🎉"],
-    "business": ["📈", "💼", "🎯", "🏆"],
-    "default": ["⭐", "✨", "🎯", "💡"],
+    "coffee": ("☕", "🫘", "☕"),
+    "tech": ("💻", "🚀", "📱", "⚡"),
+    "fashion": ("👗", "👠", "✨", "💎"),
+    "food": ("🍽️", "🍕", "🍔", "🥗"),
+    "fitness": ("💪", "🏋️", "🔥", "⚡"),
+    "beauty": ("✨", "💄", "🌸", "💅"),
+    "travel": ("✈️", "🌴", "🏖️", "🗺️"),
+    "sale": ("🔥", "💥", "⚡", "🎉"),
+    "business": ("📈", "💼", "🎯", "🏆"),
+    "default": ("⭐", "✨", "🎯", "💡"),
+}
+
+FORMAT_SIZES = {
+    "post": (1080, 1080), "square": (1080, 1080),
+    "story": (1080, 1920), "reel": (1080, 1920),
+    "landscape": (1200, 628), "portrait": (1080, 1350),
 }
 
 # =============================================================================
 # HELPER FUNCTIONS
 # =============================================================================
 
+@lru_cache(maxsize=1024)
 def get_prompt_hash(prompt: str) -> int:
     """Generate a hash from the prompt for consistent randomization"""
-    return int(hashlib.md5(prompt.encode()).hexdigest(), 16)
+    return int.from_bytes(hashlib.md5(prompt.encode()).digest(), "big")
 
+# Category keywords in priority order; the first category with a matching keyword wins
+_CATEGORY_KEYWORDS = (
+    ("coffee", ("coffee", "cafe", "café", "espresso", "latte", "brew", "roast", "barista", "cappuccino", "mocha")),
+    ("tech", ("tech", "software", "app", "digital", "ai", "smart", "startup", "saas", "cloud", "code", "developer")),
+    ("fashion", ("fashion", "style", "clothing", "wear", "collection", "luxury", "designer", "boutique", "outfit", "dress")),
+    ("food", ("food", "restaurant", "delivery", "menu", "taste", "chef", "cuisine", "eat", "delicious", "pizza", "burger")),
+    ("fitness", ("fitness", "gym", "workout", "training", "health", "exercise", "muscle", "protein", "sports", "yoga")),
+    ("beauty", ("beauty", "skincare", "cosmetic", "makeup", "glow", "skin", "cream", "serum", "spa", "facial")),
+    ("travel", ("travel", "vacation", "trip", "destination", "hotel", "flight", "adventure", "explore", "tourism", "beach")),
+    ("sale", ("sale", "discount", "offer", "deal", "save", "off", "promo", "clearance", "black friday", "flash")),
+    ("business", ("business", "corporate", "company", "enterprise", "b2b", "professional", "consulting", "agency")),
+)
+
+@lru_cache(maxsize=1024)
 def detect_category(prompt: str) -> str:
     """Detect category from prompt keywords"""
     prompt_lower = prompt.lower()
     
-    keywords = {
-        "coffee": ["coffee", "cafe", "café", "espresso", "latte", "brew", "roast", "barista", "cappuccino", "mocha"],
-        "tech": ["tech", "software", "app", "digital", "ai", "smart", "startup", "saas", "cloud", "code", "developer"],
-        "fashion": ["fashion", "style", "clothing", "wear", "collection", "luxury", "designer", "boutique", "outfit", "dress"],
-        "food": ["food", "restaurant", "delivery", "menu", "taste", "chef", "cuisine", "eat", "delicious", "pizza", "burger"],
-        "fitness": ["fitness", "gym", "workout", "training", "health", "exercise", "muscle", "protein", "sports", "yoga"],
-        "beauty": ["beauty", "skincare", "cosmetic", "makeup", "glow", "skin", "cream", "serum", "spa", "facial"],
-        "travel": ["travel", "vacation", "trip", "destination", "hotel", "flight", "adventure", "explore", "tourism", "beach"],
-        "sale": ["sale", "discount", "offer", "deal", "save", "off", "promo", "clearance", "black friday", "flash"],
-        "business": ["business", "corporate", "company", "enterprise", "b2b", "professional", "consulting", "agency"],
-    }
-    
-    for category, kw_list in keywords.items():
+    for category, kw_list in _CATEGORY_KEYWORDS:
         for kw in kw_list:
             if kw in prompt_lower:
                 return category
     return "default"
 
+_BRAND_PATTERNS = (
+    re.compile(r"(?:named|called|for|brand)\s+['\"]?([A-Z][a-zA-Z0-9']+(?:\s+[A-Z][a-zA-Z0-9']+)?)['\"]?", re.IGNORECASE),
+    re.compile(r"([A-Z][a-zA-Z']+(?:'s)?)\s+(?:coffee|shop|store|brand|business|company)", re.IGNORECASE),
+    re.compile(r"my\s+(?:brand|company|business|shop|store)\s+(?:named|called)?\s*['\"]?([A-Za-z][a-zA-Z0-9']+)['\"]?", re.IGNORECASE),
+)
+
+@lru_cache(maxsize=1024)
 def extract_brand_name(prompt: str) -> Optional[str]:
     """Extract brand name from prompt"""
-    patterns = [
-        r"(?:named|called|for|brand)\s+['\"]?([A-Z][a-zA-Z0-9']+(?:\s+[A-Z][a-zA-Z0-9']+)?)['\"]?",
-        r"([A-Z][a-zA-Z']+(?:'s)?)\s+(?:coffee|shop|store|brand|business|company)",
-        r"my\s+(?:brand|company|business|shop|store)\s+(?:named|called)?\s*['\"]?([A-Za-z][a-zA-Z0-9']+)['\"]?",
-    ]
-    for pattern in patterns:
-        match = re.search(pattern, prompt, re.IGNORECASE)
+    for pattern in _BRAND_PATTERNS:
+        match = pattern.search(prompt)
         if match:
             name = match.group(1).strip().strip("'\"")
             if len(name) > 1:
                 return name
     return None
 
-def get_random_with_seed(items: list, seed: int, offset: int = 0) -> Any:
+def get_random_with_seed(items: Sequence, seed: int, offset: int = 0) -> Any:
     """Get random item using seed for consistency"""
     idx = (seed + offset) % len(items)
     return items[idx]
 
+@lru_cache(maxsize=1024)
+def select_content(category: str, seed: int) -> Tuple[str, str, str, str, str, str]:
+    """Pick headline, subheadline, CTA, badge, icon and emoji for a category and seed"""
+    headlines = HEADLINES_BY_CATEGORY.get(category, HEADLINES_BY_CATEGORY["default"])
+    subs = SUBHEADLINES.get(category, SUBHEADLINES["default"])
+    ctas = CTAS.get(category, CTAS["default"])
+    badges = BADGES.get(category, BADGES["default"])
+    icons = ICONS_BY_CATEGORY.get(category, ICONS_BY_CATEGORY["default"])
+    emojis = INDUSTRY_EMOJIS.get(category, INDUSTRY_EMOJIS["default"])
+    return (
+        get_random_with_seed(headlines, seed, 0),
+        get_random_with_seed(subs, seed, 1),
+        get_random_with_seed(ctas, seed, 2),
+        get_random_with_seed(badges, seed, 3),
+        get_random_with_seed(icons, seed, 4),
+        get_random_with_seed(emojis, seed, 5),
+    )
+
 # =============================================================================
 # DECORATIVE ELEMENTS GENERATORS
 # =============================================================================
 
-def generate_background_shapes(palette: Dict, seed: int, style: str) -> List[Dict]:
+# Glow circle positions, one pair per seed variant
+_GLOW_POSITIONS = (
+    ((-15, -15), (75, 70)),
+    ((80, -10), (-10, 80)),
+    ((50, -20), (20, 85)),
+    ((-20, 50), (85, 20)),
+)
+
+# Corner accents per corner style: (shape_type, x, y, width, height, opacity)
+_CORNER_SHAPES = (
+    # L-shaped corners
+    (
+        ("rect", 5, 5, 12, 0.4, 0.7),
+        ("rect", 5, 5, 0.4, 12, 0.7),
+        ("rect", 83, 95, 12, 0.4, 0.7),
+        ("rect", 95, 83, 0.4, 12, 0.7),
+    ),
+    # Circle corners
+    (
+        ("circle", 5, 5, 8, 8, 0.3),
+        ("circle", 87, 87, 8, 8, 0.3),
+    ),
+    # Full frame
+    (
+        ("rect", 4, 4, 92, 0.3, 0.2),
+        ("rect", 4, 96, 92, 0.3, 0.2),
+        ("rect", 4, 4, 0.3, 92, 0.2),
+        ("rect", 96, 4, 0.3, 92, 0.2),
+    ),
+    # No corners
+    (),
+)
+
+# Badge anchor per layout badge position; "none" has no badge
+_BADGE_POSITIONS = {
+    "top_left": (6, 6),
+    "top_center": (35, 6),
+    "top_right": (65, 6),
+    "bottom_right": (65, 88),
+    "floating": (75, 15),
+    "none": None,
+}
+
+def generate_background_shapes(palette: Mapping, seed: int, style: str) -> List[Dict]:
     """Generate varied background decorative elements based on style"""
-    shapes = []
-    random.seed(seed)
-    
+    return add_background_shapes([], palette, seed, style)
+
+@lru_cache(maxsize=1024)
+def _glow_jitter(seed: int, count: int) -> Tuple[Tuple[int, int, float], ...]:
+    """Seeded (width, height, opacity) jitter for count glow circles"""
+    # Private generator: same sequence as seeding the global one, without clobbering it
+    rng = random.Random(seed)
+    return tuple(
+        (45 + rng.randint(0, 15), 45 + rng.randint(0, 15), 0.08 + rng.random() * 0.05)
+        for _ in range(count)
+    )
+
+def add_background_shapes(shapes: List[Dict], palette: Mapping, seed: int, style: str) -> List[Dict]:
+    """Append background decorative elements to shapes and return it"""
     # Large glow circles (position varies)
-    glow_positions = [
-        [(-15, -15), (75, 70)],
-        [(80, -10), (-10, 80)],
-        [(50, -20), (20, 85)],
-        [(-20, 50), (85, 20)],
-    ]
-    glow_pos = glow_positions[seed % len(glow_positions)]
-    
-    for i, (x, y) in enumerate(glow_pos):
+    glow_pos = _GLOW_POSITIONS[seed % len(_GLOW_POSITIONS)]
+    
+    for i, ((x, y), (w, h, opacity)) in enumerate(zip(glow_pos, _glow_jitter(seed, len(glow_pos)))):
         shapes.append({
             "type": "shape", "shape_type": "circle",
             "position": {"x": x, "y": y},
-            "size": {"width": 45 + random.randint(0, 15), "height": 45 + random.randint(0, 15)},
+            "size": {"width": w, "height": h},
             "fill_color": palette["glow"] if i == 0 else palette["accent2"],
-            "opacity": 0.08 + random.random() * 0.05,
+            "opacity": opacity,
         })
     
     # Style-specific elements
@@ -436,49 +527,39 @@ def generate_background_shapes(palette: Dict, seed: int, style: str) -> List[Dic
     
     # Random decorative dots
     num_dots = 4 + (seed % 4)
+    dot_colors = palette["shapes"]
+    num_colors = len(dot_colors)
     for i in range(num_dots):
         x = 5 + ((seed + i * 17) % 85)
         y = 5 + ((seed + i * 23) % 85)
+        dot_size = 2 + (i % 3)
         shapes.append({
             "type": "shape", "shape_type": "circle",
             "position": {"x": x, "y": y},
-            "size": {"width": 2 + (i % 3), "height": 2 + (i % 3)},
-            "fill_color": palette["shapes"][i % len(palette["shapes"])],
+            "size": {"width": dot_size, "height": dot_size},
+            "fill_color": dot_colors[i % num_colors],
             "opacity": 0.3 + (i % 3) * 0.1,
         })
     
     # Corner accents (varied by seed)
-    corner_styles = seed % 4
-    if corner_styles == 0:
-        # L-shaped corners
-        shapes.extend([
-            {"type": "shape", "shape_type": "rect", "position": {"x": 5, "y": 5}, "size": {"width": 12, "height": 0.4}, "fill_color": palette["accent1"], "opacity": 0.7},
-            {"type": "shape", "shape_type": "rect", "position": {"x": 5, "y": 5}, "size": {"width": 0.4, "height": 12}, "fill_color": palette["accent1"], "opacity": 0.7},
-            {"type": "shape", "shape_type": "rect", "position": {"x": 83, "y": 95}, "size": {"width": 12, "height": 0.4}, "fill_color": palette["accent1"], "opacity": 0.7},
-            {"type": "shape", "shape_type": "rect", "position": {"x": 95, "y": 83}, "size": {"width": 0.4, "height": 12}, "fill_color": palette["accent1"], "opacity": 0.7},
-        ])
-    elif corner_styles == 1:
-        # Circle corners
-        shapes.extend([
-            {"type": "shape", "shape_type": "circle", "position": {"x": 5, "y": 5}, "size": {"width": 8, "height": 8}, "fill_color": palette["accent1"], "opacity": 0.3},
-            {"type": "shape", "shape_type": "circle", "position": {"x": 87, "y": 87}, "size": {"width": 8, "height": 8}, "fill_color": palette["accent1"], "opacity": 0.3},
-        ])
-    elif corner_styles == 2:
-        # Full frame
-        shapes.extend([
-            {"type": "shape", "shape_type": "rect", "position": {"x": 4, "y": 4}, "size": {"width": 92, "height": 0.3}, "fill_color": palette["accent1"], "opacity": 0.2},
-            {"type": "shape", "shape_type": "rect", "position": {"x": 4, "y": 96}, "size": {"width": 92, "height": 0.3}, "fill_color": palette["accent1"], "opacity": 0.2},
-            {"type": "shape", "shape_type": "rect", "position": {"x": 4, "y": 4}, "size": {"width": 0.3, "height": 92}, "fill_color": palette["accent1"], "opacity": 0.2},
-            {"type": "shape", "shape_type": "rect", "position": {"x": 96, "y": 4}, "size": {"width": 0.3, "height": 92}, "fill_color": palette["accent1"], "opacity": 0.2},
-        ])
+    accent1 = palette["accent1"]
+    for shape_type, x, y, w, h, opacity in _CORNER_SHAPES[seed % 4]:
+        shapes.append({
+            "type": "shape", "shape_type": shape_type,
+            "position": {"x": x, "y": y},
+            "size": {"width": w, "height": h},
+            "fill_color": accent1,
+            "opacity": opacity,
+        })
     
     return shapes
 
-def generate_accent_shapes(palette: Dict, seed: int, accent_side: str) -> List[Dict]:
+def generate_accent_shapes(palette: Mapping, seed: int, accent_side: str) -> List[Dict]:
     """Generate accent shapes on specified side"""
-    shapes = []
-    random.seed(seed + 100)
-    
+    return add_accent_shapes([], palette, seed, accent_side)
+
+def add_accent_shapes(shapes: List[Dict], palette: Mapping, seed: int, accent_side: str) -> List[Dict]:
+    """Append accent shapes on specified side to shapes and return it"""
     if accent_side == "right":
         shapes.extend([
             {"type": "shape", "shape_type": "circle", "position": {"x": 65, "y": 25}, "size": {"width": 40, "height": 40}, "fill_color": palette["accent1"], "opacity": 0.12},
@@ -524,7 +605,6 @@ def generate_premium_design(prompt: str, platform: str = "instagram",
     
     # Get seed from prompt for consistent but unique randomization
     seed = get_prompt_hash(prompt)
-    random.seed(seed)
     
     # Detect category from prompt
     category = detect_category(prompt)
@@ -537,41 +617,34 @@ def generate_premium_design(prompt: str, platform: str = "instagram",
     layout_idx = (seed // 7) % len(LAYOUT_STYLES)
     layout = LAYOUT_STYLES[layout_idx]
     
+    # Frequently used layout and palette fields
+    layout_id = layout["id"]
+    accent_side = layout["accent_side"]
+    headline_pos = layout["headline_pos"]
+    headline_x, headline_y = headline_pos["x"], headline_pos["y"]
+    headline_w, headline_h = layout["headline_size"]["w"], layout["headline_size"]["h"]
+    sub_pos = layout["sub_pos"]
+    cta_pos = layout["cta_pos"]
+    cta_x, cta_y = cta_pos["x"], cta_pos["y"]
+    cta_w = layout["cta_size"]["w"]
+    accent1 = palette["accent1"]
+    text_light = palette["text_light"]
+    text_dark = palette["text_dark"]
+    
     # Canvas size
-    FORMAT_SIZES = {
-        "post": (1080, 1080), "square": (1080, 1080),
-        "story": (1080, 1920), "reel": (1080, 1920),
-        "landscape": (1200, 628), "portrait": (1080, 1350),
-    }
     width, height = FORMAT_SIZES.get(format.lower(), (1080, 1080))
     
     # Extract brand name
     brand_name = extract_brand_name(prompt)
     
     # Select content with seed for variety
-    headlines = HEADLINES_BY_CATEGORY.get(category, HEADLINES_BY_CATEGORY["default"])
-    headline = get_random_with_seed(headlines, seed, 0)
-    
-    subs = SUBHEADLINES.get(category, SUBHEADLINES["default"])
-    subheadline = get_random_with_seed(subs, seed, 1)
-    
-    ctas = CTAS.get(category, CTAS["default"])
-    cta_text = get_random_with_seed(ctas, seed, 2)
-    
-    badges = BADGES.get(category, BADGES["default"])
-    badge_text = get_random_with_seed(badges, seed, 3)
-    
-    icons = ICONS_BY_CATEGORY.get(category, ICONS_BY_CATEGORY["default"])
-    icon = get_random_with_seed(icons, seed, 4)
-    
-    emojis = INDUSTRY_EMOJIS.get(category, INDUSTRY_EMOJIS["default"])
-    emoji = get_random_with_seed(emojis, seed, 5)
+    headline, subheadline, cta_text, badge_text, icon, emoji = select_content(category, seed)
     
     # Build elements
     elements = []
     
     # 1. BACKGROUND DECORATIVE SHAPES
-    elements.extend(generate_background_shapes(palette, seed, layout["id"]))
+    add_background_shapes(elements, palette, seed, layout_id)
     
     # 2. OVERLAY for depth
     overlay_opacity = 0.2 + (seed % 3) * 0.05
@@ -584,36 +657,29 @@ def generate_premium_design(prompt: str, platform: str = "instagram",
     })
     
     # 3. ACCENT SHAPES
-    elements.extend(generate_accent_shapes(palette, seed, layout["accent_side"]))
+    add_accent_shapes(elements, palette, seed, accent_side)
     
     # 4. BADGE (position varies by layout)
-    badge_positions = {
-        "top_left": {"x": 6, "y": 6},
-        "top_center": {"x": 35, "y": 6},
-        "top_right": {"x": 65, "y": 6},
-        "bottom_right": {"x": 65, "y": 88},
-        "floating": {"x": 75, "y": 15},
-        "none": None,
-    }
-    badge_pos = badge_positions.get(layout["badge_pos"])
+    badge_pos = _BADGE_POSITIONS.get(layout["badge_pos"])
     if badge_pos:
+        badge_x, badge_y = badge_pos
         elements.append({
             "type": "shape", "shape_type": "rect",
-            "position": badge_pos,
+            "position": {"x": badge_x, "y": badge_y},
             "size": {"width": 28, "height": 5},
-            "fill_color": palette["accent1"],
+            "fill_color": accent1,
             "corner_radius": 25,
             "opacity": 0.95,
         })
         elements.append({
             "type": "text",
-            "position": {"x": badge_pos["x"], "y": badge_pos["y"] + 0.5},
+            "position": {"x": badge_x, "y": badge_y + 0.5},
             "size": {"width": 28, "height": 4},
             "content": badge_text,
             "font_size": 13,
             "font_weight": 700,
             "font_family": "Inter",
-            "color": palette["text_dark"],
+            "color": text_dark,
             "align": "center",
             "letter_spacing": 1,
         })
@@ -622,54 +688,50 @@ def generate_premium_design(prompt: str, platform: str = "instagram",
     if brand_name:
         elements.append({
             "type": "text",
-            "position": {"x": layout["headline_pos"]["x"], "y": layout["headline_pos"]["y"] - 10},
+            "position": {"x": headline_x, "y": headline_y - 10},
             "size": {"width": 60, "height": 5},
             "content": brand_name.upper(),
             "font_size": 15,
             "font_weight": 600,
             "font_family": "Inter",
-            "color": palette["accent1"],
-            "align": "left" if "left" in layout["id"] else "center",
+            "color": accent1,
+            "align": _BRAND_ALIGN[layout_id],
             "letter_spacing": 4,
         })
     
     # 6. DECORATIVE ICON
-    icon_y = layout["headline_pos"]["y"] - 5 if brand_name else layout["headline_pos"]["y"] - 8
+    icon_y = headline_y - 5 if brand_name else headline_y - 8
     elements.append({
         "type": "text",
-        "position": {"x": layout["headline_pos"]["x"], "y": icon_y},
+        "position": {"x": headline_x, "y": icon_y},
         "size": {"width": 10, "height": 8},
         "content": icon,
         "font_size": 32,
-        "color": palette["accent1"],
+        "color": accent1,
         "align": "left",
         "opacity": 0.7,
     })
     
     # 7. MAIN HEADLINE
-    headline_align = "left"
-    if "center" in layout["id"]:
-        headline_align = "center"
-    elif "right" in layout["id"]:
-        headline_align = "right"
+    headline_align = _HEADLINE_ALIGN[layout_id]
     
     elements.append({
         "type": "text",
-        "position": layout["headline_pos"],
-        "size": {"width": layout["headline_size"]["w"], "height": layout["headline_size"]["h"]},
+        "position": headline_pos,
+        "size": {"width": headline_w, "height": headline_h},
         "content": headline,
         "font_size": 68 + (seed % 10),
         "font_weight": 900,
         "font_family": "Montserrat",
-        "color": palette["text_light"],
+        "color": text_light,
         "align": headline_align,
         "line_height": 0.95,
         "letter_spacing": -1,
     })
     
     # 8. ACCENT LINE under headline
-    line_y = layout["headline_pos"]["y"] + layout["headline_size"]["h"] + 2
-    line_x = layout["headline_pos"]["x"]
+    line_y = headline_y + headline_h + 2
+    line_x = headline_x
     if headline_align == "center":
         line_x = 40
     elif headline_align == "right":
@@ -679,30 +741,30 @@ def generate_premium_design(prompt: str, platform: str = "instagram",
         "type": "shape", "shape_type": "rect",
         "position": {"x": line_x, "y": line_y},
         "size": {"width": 18, "height": 0.8},
-        "fill_color": palette["accent1"],
+        "fill_color": accent1,
         "opacity": 1,
     })
     
     # 9. SUBHEADLINE
     elements.append({
         "type": "text",
-        "position": layout["sub_pos"],
+        "position": sub_pos,
         "size": {"width": layout["sub_size"]["w"], "height": layout["sub_size"]["h"]},
         "content": subheadline,
         "font_size": 18 + (seed % 4),
         "font_weight": 400,
         "font_family": "Inter",
-        "color": palette["text_light"],
+        "color": text_light,
         "align": headline_align,
         "opacity": 0.9,
     })
     
     # 10. FEATURE BADGES (vary by seed)
     if seed % 3 != 0:  # Show 2/3 of the time
-        features = ["✓ Premium", "✓ Fast", "✓ Quality"]
-        feature_y = layout["sub_pos"]["y"] + 10
+        features = ("✓ Premium", "✓ Fast", "✓ Quality")
+        feature_y = sub_pos["y"] + 10
         for i, feature in enumerate(features):
-            fx = layout["headline_pos"]["x"] + (i * 25)
+            fx = headline_x + (i * 25)
             if headline_align == "center":
                 fx = 15 + (i * 25)
             elements.append({
@@ -713,7 +775,7 @@ def generate_premium_design(prompt: str, platform: str = "instagram",
                 "font_size": 11,
                 "font_weight": 500,
                 "font_family": "Inter",
-                "color": palette["accent1"],
+                "color": accent1,
                 "align": "left",
                 "opacity": 0.85,
             })
@@ -721,43 +783,43 @@ def generate_premium_design(prompt: str, platform: str = "instagram",
     # 11. CTA BUTTON
     elements.append({
         "type": "shape", "shape_type": "rect",
-        "position": layout["cta_pos"],
-        "size": {"width": layout["cta_size"]["w"], "height": layout["cta_size"]["h"]},
-        "fill_color": palette["accent1"],
+        "position": cta_pos,
+        "size": {"width": cta_w, "height": layout["cta_size"]["h"]},
+        "fill_color": accent1,
         "corner_radius": 6 + (seed % 4),
     })
     elements.append({
         "type": "text",
-        "position": {"x": layout["cta_pos"]["x"], "y": layout["cta_pos"]["y"] + 2},
-        "size": {"width": layout["cta_size"]["w"], "height": 6},
+        "position": {"x": cta_x, "y": cta_y + 2},
+        "size": {"width": cta_w, "height": 6},
         "content": cta_text.upper(),
         "font_size": 15,
         "font_weight": 700,
         "font_family": "Inter",
-        "color": palette["text_dark"],
+        "color": text_dark,
         "align": "center",
         "letter_spacing": 2,
     })
     
     # 12. SECONDARY CTA (50% of designs)
     if seed % 2 == 0:
-        sec_cta_x = layout["cta_pos"]["x"] + layout["cta_size"]["w"] + 5
+        sec_cta_x = cta_x + cta_w + 5
         elements.append({
             "type": "text",
-            "position": {"x": sec_cta_x, "y": layout["cta_pos"]["y"] + 2.5},
+            "position": {"x": sec_cta_x, "y": cta_y + 2.5},
             "size": {"width": 25, "height": 5},
             "content": "Learn More →",
             "font_size": 13,
             "font_weight": 500,
             "font_family": "Inter",
-            "color": palette["text_light"],
+            "color": text_light,
             "align": "left",
             "opacity": 0.75,
         })
     
     # 13. LARGE EMOJI/ICON
-    emoji_x = 72 if layout["accent_side"] == "right" else 15
-    emoji_y = 40 if layout["accent_side"] == "right" else 70
+    emoji_x = 72 if accent_side == "right" else 15
+    emoji_y = 40 if accent_side == "right" else 70
     elements.append({
         "type": "text",
         "position": {"x": emoji_x, "y": emoji_y},
@@ -797,10 +859,10 @@ def generate_premium_design(prompt: str, platform: str = "instagram",
         "brand_name": brand_name,
         "elements": elements,
         "color_palette": {
-            "primary": palette["accent1"],
+            "primary": accent1,
             "secondary": palette["accent2"],
             "accent": palette["highlight"],
-            "text": palette["text_light"],
+            "text": text_light,
             "glow": palette["glow"],
         }
     }
@@ -808,6 +870,27 @@ def generate_premium_design(prompt: str, platform: str = "instagram",
     return blueprint
 
 
+def generate_premium_designs_bulk(prompts: List[str], platform: str = "instagram",
+                                  format: str = "post", workers: int = 0) -> List[Dict[str, Any]]:
+    """
+    Generate one premium design per prompt.
+    With workers > 1 the prompts are spread over a process pool. Shipping each
+    blueprint back costs about as much as generating it, so only use a pool for
+    large batches on a multi-core host.
+    """
+    generate = partial(generate_premium_design, platform=platform, format=format)
+    if workers <= 1 or len(prompts) < 2:
+        return [generate(prompt) for prompt in prompts]
+    
+    chunksize = max(1, len(prompts) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(generate, prompts, chunksize=chunksize))
+
+
+# (cos, sin) for every whole-degree gradient angle; generated designs always use one
+_GRADIENT_DIRECTIONS = tuple((math.cos(math.radians(a)), math.sin(math.radians(a))) for a in range(360))
+
+
 def premium_blueprint_to_fabric(blueprint: Dict[str, Any]) -> Dict[str, Any]:
     """Convert premium blueprint to Fabric.js format"""
     
@@ -821,13 +904,19 @@ def premium_blueprint_to_fabric(blueprint: Dict[str, Any]) -> Dict[str, Any]:
     angle = bg.get("angle", 135)
     
     # Calculate gradient coordinates
-    rad = math.radians(angle)
+    if isinstance(angle, int) and 0 <= angle < 360:
+        cos_a, sin_a = _GRADIENT_DIRECTIONS[angle]
+    else:
+        rad = math.radians(angle)
+        cos_a, sin_a = math.cos(rad), math.sin(rad)
     cx, cy = width / 2, height / 2
     length = max(width, height) * 1.5
-    x1 = cx - math.cos(rad) * length / 2
-    y1 = cy - math.sin(rad) * length / 2
-    x2 = cx + math.cos(rad) * length / 2
-    y2 = cy + math.sin(rad) * length / 2
+    half_dx = cos_a * length / 2
+    half_dy = sin_a * length / 2
+    x1 = cx - half_dx
+    y1 = cy - half_dy
+    x2 = cx + half_dx
+    y2 = cy + half_dy
     
     # Create color stops
     color_stops = []
@@ -897,11 +986,13 @@ def premium_blueprint_to_fabric(blueprint: Dict[str, Any]) -> Dict[str, Any]:
                 obj["type"] = "rect"
                 obj["width"] = el_width
                 obj["height"] = el_height
-                obj["rx"] = element.get("corner_radius", 0)
-                obj["ry"] = element.get("corner_radius", 0)
+                corner_radius = element.get("corner_radius", 0)
+                obj["rx"] = corner_radius
+                obj["ry"] = corner_radius
             
-            if element.get("stroke_color"):
-                obj["stroke"] = element["stroke_color"]
+            stroke_color = element.get("stroke_color")
+            if stroke_color:
+                obj["stroke"] = stroke_color
                 obj["strokeWidth"] = element.get("stroke_width", 1)
             
             fabric_objects.append(obj)
@@ -4,8 +4,12 @@ Creates stunning, advertising-agency quality poster designs
 """
 
 import random
-from typing import Dict, List, Any, Optional
+from functools import lru_cache
+from typing import Dict, List, Any, Mapping, Optional
 import re
+import math
+
+from frozen_tables import freeze
 
 # =============================================================================
 # PROFESSIONAL COLOR PALETTES - Premium Quality
@@ -124,6 +128,10 @@ PROFESSIONAL_PALETTES = {
     }
 }
 
+# Blueprints pass background["colors"] through by reference, so a frozen
+# colour tuple keeps a caller's edit to one design out of every later one
+PROFESSIONAL_PALETTES = freeze(PROFESSIONAL_PALETTES)
+
 # =============================================================================
 # PROFESSIONAL LAYOUTS - Agency Quality
 # =============================================================================
@@ -418,36 +426,51 @@ INDUSTRY_CONTENT = {
 # PROFESSIONAL DESIGN GENERATOR
 # =============================================================================
 
+FORMAT_SIZES = {
+    "post": (1080, 1080),
+    "square": (1080, 1080),
+    "story": (1080, 1920),
+    "reel": (1080, 1920),
+    "landscape": (1200, 628),
+    "portrait": (1080, 1350),
+    "wide": (1920, 1080),
+}
+
+# Industry keywords in priority order; the first industry with a matching keyword wins
+_INDUSTRY_KEYWORDS = (
+    ("coffee", ("coffee", "cafe", "espresso", "latte", "brew", "roast", "barista")),
+    ("tech", ("tech", "software", "app", "digital", "ai", "smart", "innovation", "startup")),
+    ("fashion", ("fashion", "style", "clothing", "wear", "collection", "luxury", "designer")),
+    ("food", ("food", "restaurant", "delivery", "menu", "taste", "chef", "cuisine", "eat")),
+    ("fitness", ("fitness", "gym", "workout", "training", "health", "exercise", "muscle", "protein")),
+    ("beauty", ("beauty", "skincare", "cosmetic", "makeup", "glow", "skin", "cream", "serum")),
+    ("travel", ("travel", "vacation", "trip", "destination", "hotel", "flight", "adventure", "explore")),
+)
+
 def detect_industry(prompt: str) -> str:
     """Detect industry from prompt"""
-    prompt_lower = prompt.lower()
-    
-    industry_keywords = {
-        "coffee": ["coffee", "cafe", "espresso", "latte", "brew", "roast", "barista"],
-        "tech": ["tech", "software", "app", "digital", "ai", "smart", "innovation", "startup"],
-        "fashion": ["fashion", "style", "clothing", "wear", "collection", "luxury", "designer"],
-        "food": ["food", "restaurant", "delivery", "menu", "taste", "chef", "cuisine", "eat"],
-        "fitness": ["fitness", "gym", "workout", "training", "health", "exercise", "muscle", "protein"],
-        "beauty": ["beauty", "skincare", "cosmetic", "makeup", "glow", "skin", "cream", "serum"],
-        "travel": ["travel", "vacation", "trip", "destination", "hotel", "flight", "adventure", "explore"],
-    }
-    
-    for industry, keywords in industry_keywords.items():
+    return _detect_industry_lower(prompt.lower())
+
+@lru_cache(maxsize=1024)
+def _detect_industry_lower(prompt_lower: str) -> str:
+    """detect_industry for an already lowercased prompt"""
+    for industry, keywords in _INDUSTRY_KEYWORDS:
         for keyword in keywords:
             if keyword in prompt_lower:
                 return industry
     
     return "default"
 
+_BRAND_PATTERNS = (
+    re.compile(r"(?:for|called|named|brand)\s+(?:my\s+)?([A-Z][a-zA-Z']+(?:\s+[A-Z][a-zA-Z']+)?)", re.IGNORECASE),
+    re.compile(r"([A-Z][a-zA-Z']+(?:'s)?)\s+(?:coffee|shop|store|brand|restaurant)", re.IGNORECASE),
+)
+
+@lru_cache(maxsize=1024)
 def extract_brand_name(prompt: str) -> Optional[str]:
     """Extract brand name from prompt"""
-    patterns = [
-        r"(?:for|called|named|brand)\s+(?:my\s+)?([A-Z][a-zA-Z']+(?:\s+[A-Z][a-zA-Z']+)?)",
-        r"([A-Z][a-zA-Z']+(?:'s)?)\s+(?:coffee|shop|store|brand|restaurant)",
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, prompt, re.IGNORECASE)
+    for pattern in _BRAND_PATTERNS:
+        match = pattern.search(prompt)
         if match:
             return match.group(1).strip()
     
@@ -461,8 +484,11 @@ def generate_professional_design(prompt: str, platform: str = "instagram",
     This creates advertising-agency quality posters.
     """
     
+    prompt_lower = prompt.lower()
+    format_lower = format.lower()
+    
     # Detect industry from prompt
-    industry = industry_override or detect_industry(prompt)
+    industry = industry_override or _detect_industry_lower(prompt_lower)
     content = INDUSTRY_CONTENT.get(industry, INDUSTRY_CONTENT["default"])
     
     # Get color palette
@@ -470,9 +496,9 @@ def generate_professional_design(prompt: str, platform: str = "instagram",
     palette = PROFESSIONAL_PALETTES.get(palette_name, PROFESSIONAL_PALETTES["premium_dark"])
     
     # Select layout based on format
-    if "story" in format.lower() or "reel" in format.lower():
+    if "story" in format_lower or "reel" in format_lower:
         layout = PROFESSIONAL_LAYOUTS["instagram_story"]
-    elif "product" in prompt.lower() or "showcase" in prompt.lower():
+    elif "product" in prompt_lower or "showcase" in prompt_lower:
         layout = PROFESSIONAL_LAYOUTS["product_showcase"]
     elif random.random() > 0.5:
         layout = random.choice([
@@ -484,17 +510,7 @@ def generate_professional_design(prompt: str, platform: str = "instagram",
         layout = PROFESSIONAL_LAYOUTS["minimal_elegant"]
     
     # Determine canvas size
-    FORMAT_SIZES = {
-        "post": (1080, 1080),
-        "square": (1080, 1080),
-        "story": (1080, 1920),
-        "reel": (1080, 1920),
-        "landscape": (1200, 628),
-        "portrait": (1080, 1350),
-        "wide": (1920, 1080),
-    }
-    
-    width, height = FORMAT_SIZES.get(format.lower(), (1080, 1080))
+    width, height = FORMAT_SIZES.get(format_lower, (1080, 1080))
     
     # Extract brand name if present
     brand_name = extract_brand_name(prompt)
@@ -727,7 +743,7 @@ def generate_professional_design(prompt: str, platform: str = "instagram",
                 **base_element,
                 "type": "shape",
                 "shape_type": "rect",
-                "fill_color": palette["background"]["colors"][0] if isinstance(palette["background"], dict) else "#000000",
+                "fill_color": palette["background"]["colors"][0] if isinstance(palette["background"], Mapping) else "#000000",
                 "opacity": element.get("opacity", 0.95),
             })
         
@@ -859,12 +875,13 @@ def professional_blueprint_to_fabric(blueprint: Dict[str, Any]) -> Dict[str, Any
         colors = bg["colors"]
         
         # Calculate gradient coordinates based on angle
-        import math
         rad = math.radians(angle)
-        x1 = width/2 - math.cos(rad) * width
-        y1 = height/2 - math.sin(rad) * height
-        x2 = width/2 + math.cos(rad) * width
-        y2 = height/2 + math.sin(rad) * height
+        dx = math.cos(rad) * width
+        dy = math.sin(rad) * height
+        x1 = width/2 - dx
+        y1 = height/2 - dy
+        x2 = width/2 + dx
+        y2 = height/2 + dy
         
         fabric_objects.append({
             "type": "rect",
@@ -945,12 +962,14 @@ def professional_blueprint_to_fabric(blueprint: Dict[str, Any]) -> Dict[str, Any
                 fabric_obj["type"] = "rect"
                 fabric_obj["width"] = el_width
                 fabric_obj["height"] = el_height
-                fabric_obj["rx"] = element.get("corner_radius", 0)
-                fabric_obj["ry"] = element.get("corner_radius", 0)
+                corner_radius = element.get("corner_radius", 0)
+                fabric_obj["rx"] = corner_radius
+                fabric_obj["ry"] = corner_radius
             
             # Handle stroke
-            if element.get("stroke_color"):
-                fabric_obj["stroke"] = element["stroke_color"]
+            stroke_color = element.get("stroke_color")
+            if stroke_color:
+                fabric_obj["stroke"] = stroke_color
                 fabric_obj["strokeWidth"] = element.get("stroke_width", 1)
             
             fabric_objects.append(fabric_obj)
@@ -275,8 +275,8 @@ async def generate_from_template_endpoint(request: TemplateRequest):
 async def get_templates():
     """Get all available templates"""
     return {
-        "templates": TEMPLATE_GALLERY,
-        "categories": list(set(t["category"] for t in TEMPLATE_GALLERY))
+        "templates": [template._asdict() for template in TEMPLATE_GALLERY],
+        "categories": list(set(t.category for t in TEMPLATE_GALLERY))
     }
 
 
@@ -286,19 +286,19 @@ async def get_template(template_id: str):
     template = get_template_by_id(template_id)
     if not template:
         raise HTTPException(status_code=404, detail="Template not found")
-    return template
+    return template._asdict()
 
 
 @app.get("/palettes")
 async def get_palettes():
     """Get all available color palettes"""
-    return {"palettes": COLOR_PALETTES}
+    return {"palettes": {name: palette._asdict() for name, palette in COLOR_PALETTES.items()}}
 
 
 @app.get("/fonts")
 async def get_fonts():
     """Get all available font combinations"""
-    return {"fonts": FONT_COMBOS}
+    return {"fonts": {name: combo._asdict() for name, combo in FONT_COMBOS.items()}}
 
 
 # ============ REAL IMAGE GENERATION ENDPOINTS ============